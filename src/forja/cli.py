@@ -74,7 +74,11 @@ def cmd_init(args: argparse.Namespace) -> None:
 
 def cmd_plan(args: argparse.Namespace) -> None:
     """Run interactive PRD planning."""
-    success = run_plan(prd_path=args.prd_path, auto_mode=getattr(args, "auto", False))
+    success = run_plan(
+        prd_path=args.prd_path,
+        auto_mode=getattr(args, "auto", False),
+        fast=getattr(args, "fast", False),
+    )
     sys.exit(0 if success else 1)
 
 
@@ -187,6 +191,8 @@ def main() -> None:
     p_plan.add_argument("prd_path", nargs="?", default=str(PRD_PATH), help="Path to PRD")
     p_plan.add_argument("--auto", action="store_true",
                          help="Accept all expert defaults without prompting (autonomous mode)")
+    p_plan.add_argument("--fast", action="store_true",
+                         help="Assemble the final PRD from answers without an LLM rewrite")
     p_plan.set_defaults(func=cmd_plan)
 
     # run
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
+import shutil
 import stat
 import subprocess
 import sys
 from importlib import resources
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from forja.constants import CLAUDE_MD, FORJA_TOOLS, PRD_PATH
 from forja.utils import (
@@ -25,6 +28,9 @@ from forja.utils import (
 )
 from forja.context_setup import interactive_context_setup, _flush_stdin
 
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
+
 TEMPLATES = [
     # (source in templates/, target relative to project root)
     ("CLAUDE.md", "CLAUDE.md"),
@@ -175,16 +181,15 @@ def _copy_templates(target: Path, overwrite: bool = False) -> None:
 
     # Create empty prd.md if it doesn't exist
     prd = target / PRD_PATH
-    if not prd.exists():
+    if not os.path.lexists(prd):
         prd.write_text("# PRD\n\nDescribe your project here.\n", encoding="utf-8")
         print(f"  CREATE   {PRD_PATH}")
 
     # Create .env from global config or placeholder
     dotenv = target / ".env"
-    if not dotenv.exists():
+    if not os.path.lexists(dotenv):
         global_config = Path.home() / ".forja" / "config.env"
         if global_config.exists():
-            import shutil
             shutil.copy2(str(global_config), str(dotenv))
             print("  CREATE   .env (copied from ~/.forja/config.env)")
         else:
@@ -199,7 +204,7 @@ def _copy_templates(target: Path, overwrite: bool = False) -> None:
 
     # Create .gitignore if it doesn't exist
     gitignore = target / ".gitignore"
-    if not gitignore.exists():
+    if not os.path.lexists(gitignore):
         gitignore.write_text(".env\n.forja/\n__pycache__/\n*.pyc\nartifacts/\n", encoding="utf-8")
         print("  CREATE   .gitignore")
 
@@ -223,10 +228,9 @@ def _configure_project_permissions(target: Path) -> None:
             settings["permissions"]["allow"].append(perm)
             added.append(perm)
 
-    settings_path.write_text(
-        json.dumps(settings, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    with settings_path.open("w", encoding="utf-8") as f:
+        json.dump(settings, f, indent=2, ensure_ascii=False)
+        f.write("\n")
 
     if added:
         print(f"  {PASS_ICON} Claude Code permissions configured for autonomous execution")
@@ -238,7 +242,7 @@ def _configure_project_permissions(target: Path) -> None:
 
 def _init_git(target: Path) -> None:
     """Initialize git repo if .git/ doesn't exist."""
-    if (target / ".git").exists():
+    if os.path.exists(target / ".git"):
         print(f"  {PASS_ICON} Git already initialized")
         return
 
@@ -294,31 +298,32 @@ def _ask_skill() -> str | None:
     return skill_map.get(idx)
 
 
+def _copy_skill_file(src: Traversable, dest: Path) -> bool:
+    """Copy a single skill template file byte-for-byte. Returns True on success."""
+    try:
+        with resources.as_file(src) as src_path:
+            shutil.copyfile(src_path, dest)
+    except (OSError, TypeError):
+        return False
+    return True
+
+
 def _copy_skill(target: Path, skill_name: str) -> None:
     """Copy skill agents.json and workflow.json to the project."""
     skill_dir = resources.files("forja") / "templates" / "skills" / skill_name
-    dest_dir = target / FORJA_TOOLS
 
     # Copy agents.json → skill.json
-    try:
-        agents_src = skill_dir / "agents.json"
-        content = agents_src.read_text(encoding="utf-8")
-        (dest_dir / "skill.json").write_text(content, encoding="utf-8")
-        print(f"  {PASS_ICON} Skill '{skill_name}' configured")
-    except (OSError, TypeError):
+    if not _copy_skill_file(skill_dir / "agents.json", target / FORJA_TOOLS / "skill.json"):
         print(f"  {WARN_ICON} Skill template not found: {skill_name}")
         return
+    print(f"  {PASS_ICON} Skill '{skill_name}' configured")
 
-    # Copy workflow.json to .forja/ (runner reads WORKFLOW_PATH = .forja/workflow.json)
-    try:
-        workflow_src = skill_dir / "workflow.json"
-        content = workflow_src.read_text(encoding="utf-8")
-        forja_dir = target / ".forja"
-        forja_dir.mkdir(parents=True, exist_ok=True)
-        (forja_dir / "workflow.json").write_text(content, encoding="utf-8")
+    # Copy workflow.json to .forja/ (runner reads WORKFLOW_PATH = .forja/workflow.json).
+    # workflow.json is optional for skills without pipelines.
+    forja_dir = target / ".forja"
+    forja_dir.mkdir(parents=True, exist_ok=True)
+    if _copy_skill_file(skill_dir / "workflow.json", forja_dir / "workflow.json"):
         print(f"  {PASS_ICON} Workflow pipeline configured")
-    except (OSError, TypeError):
-        pass  # workflow.json is optional for skills without pipelines
 
 
 # ── Main entry point ─────────────────────────────────────────────────
@@ -331,6 +336,12 @@ _FORBIDDEN_INIT_DIRS = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _forbidden_init_targets() -> frozenset[Path]:
+    """Return :data:`_FORBIDDEN_INIT_DIRS` resolved, computed on first use."""
+    return frozenset(Path(p).resolve() for p in _FORBIDDEN_INIT_DIRS)
+
+
 def run_init(directory: str = ".", force: bool = False, upgrade: bool = False) -> bool:
     """Main init entrypoint.
 
@@ -340,10 +351,9 @@ def run_init(directory: str = ".", force: bool = False, upgrade: bool = False) -
         upgrade: Only copy templates (skip context, git, skills, preflight).
     """
     target = Path(directory).resolve()
-    home = Path.home().resolve()
 
     # Reject system directories and home root
-    if str(target) in _FORBIDDEN_INIT_DIRS or target == home:
+    if target in _forbidden_init_targets() or target == Path.home().resolve():
         print(f"{FAIL_ICON} Refusing to init in {target} — pick a project subdirectory.")
         return False
 
@@ -0,0 +1,108 @@
+"""Forja LLM response cache — content-addressed, on-disk, opt-in.
+
+Each entry is a small JSON file named after the SHA-256 of everything
+that shapes the response (system prompt, user prompt, model).  Re-running
+plan mode on an unchanged PRD then skips the LLM round-trip entirely.
+
+Caching is off unless ``FORJA_LLM_CACHE=1``: forja does not pin
+temperature, so a cached answer is one sample, not *the* answer.
+``FORJA_NO_CACHE=1`` overrides every opt-in and forces a fresh call.
+
+Design principles:
+- Zero external deps (stdlib only).
+- Reads are defensive (missing/corrupt/expired entry → miss).
+- Writes are atomic (temp file + ``os.replace``), so a concurrent
+  reader never sees a half-written entry.
+- Callers own the directory, so each use keeps its own namespace.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("forja")
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+# Lookup outcomes for this process (get); see stats().
+_stats = {"hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ("1", "true", "yes")
+
+
+def enabled(env_var: str = "FORJA_LLM_CACHE") -> bool:
+    """Return True when caching is switched on via *env_var*.
+
+    ``FORJA_NO_CACHE`` wins over any opt-in variable.
+    """
+    if _env_flag("FORJA_NO_CACHE"):
+        return False
+    return _env_flag(env_var)
+
+
+def cache_key(system: str, prompt: str, model: str) -> str:
+    """Return the SHA-256 hex digest identifying an LLM request."""
+    return hashlib.sha256(
+        f"{system}\0{prompt}\0{model}".encode("utf-8")
+    ).hexdigest()
+
+
+def stats() -> dict[str, int]:
+    """Return a copy of the ``{"hits": n, "misses": n}`` lookup counters."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_stats() -> None:
+    """Zero the lookup counters (e.g. at the start of a plan session)."""
+    with _stats_lock:
+        _stats.update(hits=0, misses=0)
+
+
+def _count(value: Any) -> Any:
+    with _stats_lock:
+        _stats["misses" if value is None else "hits"] += 1
+    return value
+
+
+def get(directory: Path, key: str, ttl: float = DEFAULT_TTL_SECONDS) -> Any:
+    """Return the value cached under *key*, or None on miss / expiry."""
+    return _count(_read(directory, key, ttl))
+
+
+def _read(directory: Path, key: str, ttl: float) -> Any:
+    path = directory / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return json.loads(path.read_text(encoding="utf-8")).get("value")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def put(directory: Path, key: str, value: Any) -> None:
+    """Store *value* (JSON-serialisable) under *key*; failures are logged only."""
+    path = directory / f"{key}.json"
+    tmp = path.with_name(f".{key}.{os.getpid()}.tmp")
+    try:
+        payload = json.dumps({"value": value, "ts": time.time()}, ensure_ascii=False)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(payload, encoding="utf-8")
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError) as exc:
+        logger.debug("Could not write LLM cache %s: %s", path, exc)
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
@@ -11,15 +11,22 @@ Usage:
 
 from __future__ import annotations
 
-import glob as glob_mod
+import functools
+import hashlib
 import json
 import logging
 import os
+import re
+import sys
+import threading
 import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 logger = logging.getLogger("forja")
 
+from forja import llm_cache
 from forja.constants import (
     CONTEXT_DIR, FORJA_DIR, LEARNINGS_DIR, PRD_PATH, STORE_DIR,
 )
@@ -41,6 +48,20 @@ from forja.utils import (
 
 EXPERT_COLORS = [CYAN, YELLOW, RED]
 
+# ── Console formats (colors are constant, so build them once) ───────
+
+_ROUND1_HEADER = f"\n{BOLD}  ═══ Round 1: WHAT to build ═══{RESET}"
+_ROUND2_HEADER = f"\n{BOLD}  ═══ Round 2: HOW to build it ═══{RESET}"
+_SUMMARY_FMT = (
+    f"  {BOLD}{{round_label}} Summary:{RESET} {GREEN}{{facts}} facts{RESET}, "
+    f"{CYAN}{{accepted}} accepted{RESET}, "
+    f"{YELLOW}{{skipped}} skipped{RESET}"
+)
+# One PRD bullet per transcript answer (manual-assembly fallbacks).
+_ANSWER_LINE_FMT = "- [{tag}] {question}: {answer}\n"
+# Trailer for a truncated PRD preview.
+_MORE_LINES_FMT = f"  {DIM}... ({{}} more lines){RESET}"
+
 # ── Fallback questions if Kimi unavailable ──────────────────────────
 
 FALLBACK_EXPERTS = [
@@ -173,12 +194,71 @@ SKILL_PRD_CONSTRAINTS = {
 }
 
 
+# Per-round focus, appended to SKILL_EXPERT_GUIDANCE for each panel.
+SKILL_WHAT_GUIDANCE = {
+    "landing-page": (
+        "Focus WHAT questions on: copy and messaging, page sections and flow, "
+        "CTA strategy, audience targeting, visual hierarchy, tone of voice. "
+        "Do NOT ask about databases, APIs, or deployment."
+    ),
+    "api-backend": (
+        "Focus WHAT questions on: API design and endpoints, data model, "
+        "business rules, user flows, input/output contracts. "
+        "Do NOT ask about visual design, CSS, or frontend layout."
+    ),
+}
+
+SKILL_HOW_GUIDANCE = {
+    "landing-page": (
+        "Focus HOW questions on: HTML/CSS framework, build tooling, "
+        "hosting constraints, asset pipeline, responsive strategy. "
+        "Keep it simple — vanilla HTML/CSS/JS is preferred."
+    ),
+    "api-backend": (
+        "Focus HOW questions on: framework choice (FastAPI/Flask), "
+        "database (SQLite only), auth mechanism, error handling, "
+        "deployment (uvicorn). All deps must be pip-installable."
+    ),
+}
+
+
+def _file_signature(paths: tuple[str | Path, ...]) -> tuple:
+    """Cache key for files read relative to cwd: cwd plus (mtime_ns, size) per path."""
+    sig = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            sig.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append(None)
+    return (os.getcwd(), tuple(sig))
+
+
+# Agent names that identify a skill when the skill file has no "skill" field.
+_LANDING_PAGE_AGENTS = frozenset({"frontend-builder", "seo-optimizer"})
+_API_BACKEND_AGENTS = frozenset({"database", "security"})
+
+# Checked in priority order; plain strings keep the per-call stat off pathlib.
+_SKILL_FILES = (".forja/skill/agents.json", ".forja-tools/skill.json")
+
+
 def _detect_skill() -> str:
-    """Detect which skill is active. Returns 'landing-page', 'api-backend', or 'custom'."""
-    for path in [Path(".forja/skill/agents.json"), Path(".forja-tools/skill.json")]:
-        if path.exists():
+    """Detect which skill is active. Returns 'landing-page', 'api-backend', or 'custom'.
+
+    Memoized per process; the result is recomputed when the working
+    directory or either skill file changes.
+    """
+    return _detect_skill_cached(_SKILL_FILES, _file_signature(_SKILL_FILES))
+
+
+@functools.lru_cache(maxsize=8)
+def _detect_skill_cached(paths: tuple[str, ...], signature: tuple) -> str:
+    # The signature already stat'ed every path; None marks a missing file.
+    for path, stat in zip(paths, signature[1]):
+        if stat is not None:
             try:
-                data = json.loads(path.read_text(encoding="utf-8"))
+                with open(path, "rb") as f:
+                    data = json.loads(f.read())
                 # Handle dict format: {"skill": "landing-page", "agents": [...]}
                 if isinstance(data, dict):
                     skill_field = data.get("skill", "")
@@ -187,19 +267,71 @@ def _detect_skill() -> str:
                     agents = data.get("agents", [])
                 else:
                     agents = data if isinstance(data, list) else []
-                agent_names = [a.get("name", "") for a in agents]
-                if "frontend-builder" in agent_names or "seo-optimizer" in agent_names:
+                agent_names = frozenset(a.get("name", "") for a in agents)
+                if agent_names & _LANDING_PAGE_AGENTS:
                     return "landing-page"
-                if "database" in agent_names or "security" in agent_names:
+                if agent_names & _API_BACKEND_AGENTS:
                     return "api-backend"
             except (json.JSONDecodeError, OSError, KeyError) as exc:
                 logger.debug("Failed to read skill file %s: %s", path, exc)
     return "custom"
 
 
+# Web-search research is the most expensive call in plan mode (several
+# tool round-trips).  Experts often come back to a topic within a
+# session, so findings are memoized per (field, topic, PRD summary) until
+# the next run_plan; with FORJA_LLM_CACHE=1 they also persist on disk.
+_research_cache: dict[tuple[str, str, str], str] = {}
+
+# Trimmed off word edges by _normalize_text: "app." matches "app", while
+# "C++" and "C#" stay apart.
+_EDGE_PUNCT = ".,;:!?\"'()[]{}"
+
+
+def _normalize_text(text: str) -> str:
+    """Lowercase *text*, collapse whitespace and trim punctuation around words."""
+    words = (word.strip(_EDGE_PUNCT) for word in text.lower().split())
+    return " ".join(word for word in words if word)
+
+
+def _research_key(expert_field: str, topic: str, prd_summary: str) -> tuple[str, str, str]:
+    return (
+        expert_field,
+        _normalize_text(topic),
+        hashlib.sha256(prd_summary.encode("utf-8")).hexdigest(),
+    )
+
+
+def _lookup_research(key: tuple[str, str, str]) -> str | None:
+    """Return memoized findings for *key*, or None.
+
+    Only the same normalized topic for the same expert field and PRD
+    summary matches; a differently worded topic is researched afresh.
+    """
+    cached = _research_cache.get(key)
+    if cached is None and llm_cache.enabled():
+        stored = llm_cache.get(FORJA_DIR / "cache" / "research", llm_cache.cache_key(*key))
+        if isinstance(stored, str) and stored:
+            cached = _research_cache[key] = stored
+    return cached
+
+
+def _store_research(key: tuple[str, str, str], text: str) -> None:
+    _research_cache[key] = text
+    if llm_cache.enabled():
+        llm_cache.put(FORJA_DIR / "cache" / "research", llm_cache.cache_key(*key), text)
+
+
 def _call_claude_research(expert_name, expert_field, topic, prd_summary):
-    """Call Claude API with web search tool for expert research."""
-    from forja.config_loader import load_config
+    """Call Claude API with web search tool for expert research.
+
+    Results are memoized, see :data:`_research_cache`.
+    """
+    key = _research_key(expert_field, topic, prd_summary)
+    cached = _lookup_research(key)
+    if cached is not None:
+        return cached
+
     user_content = (
         f"You are {expert_name}, {expert_field}. "
         f"Research this topic for a software project: {topic}\n\n"
@@ -211,9 +343,29 @@ def _call_claude_research(expert_name, expert_field, topic, prd_summary):
     )
     try:
         result = _call_claude_code(user_content, timeout=60)
-        return result if result else None
     except (OSError, TimeoutError, RuntimeError):
         return None
+    if not result:
+        return None
+    _store_research(key, result)
+    return result
+
+
+# Upper bound on simultaneous web-search calls (each is a slow, I/O-bound request).
+_RESEARCH_MAX_WORKERS = 5
+
+
+def _call_claude_research_many(jobs):
+    """Run several :func:`_call_claude_research` calls concurrently.
+
+    *jobs* is a list of ``(expert_name, expert_field, topic, prd_summary)``
+    tuples. Returns the results in the same order, so wall-clock time is
+    that of the slowest call rather than the sum of all of them.
+    """
+    if len(jobs) <= 1:
+        return [_call_claude_research(*job) for job in jobs]
+    with ThreadPoolExecutor(max_workers=min(_RESEARCH_MAX_WORKERS, len(jobs))) as pool:
+        return list(pool.map(lambda job: _call_claude_research(*job), jobs))
 
 
 # ── PRD from scratch ───────────────────────────────────────────────
@@ -271,53 +423,74 @@ Return JSON:
 """
 
 
+# Template comment lines (starting with "<!--" or "-->") stripped from
+# context markdown in one pass.
+_COMMENT_LINE_RE = re.compile(r"^(?:<!--|-->).*\n?", re.MULTILINE)
+
+# Per-domain context files and the section key each one feeds.
+_DOMAIN_FILE_MAP = (
+    ("DOMAIN.md", "audience"),
+    ("value-props.md", "value_props"),
+    ("objections.md", "objections"),
+)
+
+# Structured context keys in prompt order, with their headings.
+_SECTION_MAP = (
+    ("company_overview", "COMPANY OVERVIEW"),
+    ("audience", "TARGET AUDIENCE & DOMAIN"),
+    ("value_props", "VALUE PROPOSITIONS"),
+    ("objections", "OBJECTION HANDLING"),
+)
+
+
 def _read_existing_context() -> dict[str, str] | None:
     """Read context files created by context_setup into structured sections.
 
     Returns a dict with keys ``company_overview``, ``audience``,
     ``value_props``, ``objections`` (each a markdown string), or *None*
-    when no context files exist.
+    when no context files exist.  Memoized like :func:`_detect_skill`;
+    only the domain directory listing is repeated per call.
     """
-    sections: dict[str, str] = {}
-
-    def _clean(path: Path) -> str:
-        text = path.read_text(encoding="utf-8").strip()
-        lines = [l for l in text.splitlines()
-                 if not l.startswith("<!--") and not l.startswith("-->")]
-        return "\n".join(lines).strip()
-
-    # Company overview
-    overview_path = CONTEXT_DIR / "company" / "company-overview.md"
-    if overview_path.exists():
-        text = _clean(overview_path)
-        if text:
-            sections["company_overview"] = text
-
-    # Domain files: audience, value-props, objections
-    _DOMAIN_FILE_MAP = [
-        ("DOMAIN.md", "audience"),
-        ("value-props.md", "value_props"),
-        ("objections.md", "objections"),
+    paths = [CONTEXT_DIR / "company" / "company-overview.md"]
+    # scandir's is_dir() uses the d_type from the listing: no stat per domain
+    try:
+        with os.scandir(CONTEXT_DIR / "domains") as it:
+            domains = sorted(e.path for e in it if e.is_dir())
+    except OSError:
+        domains = []
+    for domain in domains:
+        paths.extend(Path(domain) / fname for fname, _key in _DOMAIN_FILE_MAP)
+    paths_t = tuple(paths)
+    sections = _read_existing_context_cached(paths_t, _file_signature(paths_t))
+    return dict(sections) if sections else None
+
+
+@functools.lru_cache(maxsize=8)
+def _read_existing_context_cached(paths: tuple[Path, ...], signature: tuple) -> dict[str, str]:
+    # Texts per key, joined once at the end (many domains feed the same keys)
+    chunks: dict[str, list[str]] = {}
+    # paths[0] is the company overview, then one _DOMAIN_FILE_MAP run per domain
+    keys = ["company_overview"] + [key for _fname, key in _DOMAIN_FILE_MAP] * (
+        (len(paths) - 1) // len(_DOMAIN_FILE_MAP)
+    )
+    present = [
+        (path, key) for path, key, stat in zip(paths, keys, signature[1]) if stat is not None
     ]
-    domains_dir = CONTEXT_DIR / "domains"
-    if domains_dir.is_dir():
-        for domain in sorted(domains_dir.iterdir()):
-            if not domain.is_dir():
-                continue
-            for fname, key in _DOMAIN_FILE_MAP:
-                fpath = domain / fname
-                if fpath.exists():
-                    text = _clean(fpath)
-                    if text:
-                        if key in sections:
-                            sections[key] += "\n\n" + text
-                        else:
-                            sections[key] = text
+    # Several domains mean many small independent files: read them together
+    if len(present) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(present))) as pool:
+            raws = list(pool.map(_read_utf8, (path for path, _key in present)))
+    else:
+        raws = [_read_utf8(path) for path, _key in present]
+    for (_path, key), raw in zip(present, raws):
+        text = _COMMENT_LINE_RE.sub("", raw.strip()).strip()
+        if text:
+            chunks.setdefault(key, []).append(text)
+    return {key: "\n\n".join(texts) for key, texts in chunks.items()}
 
-    if not sections:
-        return None
 
-    return sections
+def _read_utf8(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
 
 
 def _format_context_for_prompt(ctx: dict[str, str]) -> str:
@@ -326,12 +499,6 @@ def _format_context_for_prompt(ctx: dict[str, str]) -> str:
     Each key gets a clear heading so the model can distinguish audience data
     from objections, value-props, etc.
     """
-    _SECTION_MAP = [
-        ("company_overview", "COMPANY OVERVIEW"),
-        ("audience", "TARGET AUDIENCE & DOMAIN"),
-        ("value_props", "VALUE PROPOSITIONS"),
-        ("objections", "OBJECTION HANDLING"),
-    ]
     parts: list[str] = []
     for key, heading in _SECTION_MAP:
         text = ctx.get(key)
@@ -348,21 +515,22 @@ def _summarize_context_for_idea(ctx: dict[str, str]) -> str:
     """
     overview = ctx.get("company_overview", "")
     title = "Project"
+    desc = ""
+    title_found = desc_found = False
+    # One pass: first H1 as title, first non-heading, non-empty line as description
     for line in overview.splitlines():
         stripped = line.strip()
-        if stripped.startswith("# ") and not stripped.startswith("## "):
+        if not title_found and stripped.startswith("# "):
             title = stripped.lstrip("# ").strip()
+            title_found = True
+        elif not desc_found and stripped and not stripped.startswith("#"):
+            desc = stripped.split(".", 1)[0].strip()
+            desc_found = True
+        if title_found and desc_found:
             break
 
-    # First non-heading, non-empty line as description
-    for line in overview.splitlines():
-        stripped = line.strip()
-        if stripped and not stripped.startswith("#"):
-            desc = stripped.split(".")[0].strip()
-            if len(desc) > 10:
-                return f"{title}: {desc}"
-            break
-
+    if len(desc) > 10:
+        return f"{title}: {desc}"
     return title
 
 
@@ -371,42 +539,50 @@ def _read_design_choices() -> str:
 
     Returns a string describing the user's design settings (colors, font,
     style) ready for injection into the PRD generation prompt, or empty
-    string if no design files exist.
+    string if no design files exist.  Memoized like :func:`_detect_skill`.
     """
     brand_dir = CONTEXT_DIR / "company" / "brand-assets"
+    paths = (brand_dir / "colors.json", brand_dir / "typography.json")
+    return _read_design_choices_cached(paths, _file_signature(paths))
+
+
+def _load_json_dict(path: Path) -> dict | None:
+    """Parse a JSON object from *path*; None if missing, unreadable, or not an object."""
+    try:
+        data = json.loads(path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+@functools.lru_cache(maxsize=8)
+def _read_design_choices_cached(paths: tuple[Path, ...], signature: tuple) -> str:
+    # The two files are independent; overlap their reads.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        colors, typo = pool.map(_load_json_dict, paths)
     parts: list[str] = []
 
-    colors_path = brand_dir / "colors.json"
-    if colors_path.exists():
-        try:
-            colors = json.loads(colors_path.read_text(encoding="utf-8"))
-            primary = colors.get("primary", "")
-            secondary = colors.get("secondary", "")
-            style_key = colors.get("style", "")
-            bg = colors.get("backgrounds", {}).get("main", "")
-            text_color = colors.get("text", {}).get("primary", "")
-            if primary:
-                parts.append(f"Primary color: {primary}")
-            if secondary:
-                parts.append(f"Accent color: {secondary}")
-            if bg:
-                parts.append(f"Background: {bg}")
-            if text_color:
-                parts.append(f"Text color: {text_color}")
-            if style_key:
-                parts.append(f"Visual style: {style_key}")
-        except (json.JSONDecodeError, OSError):
-            pass
-
-    typo_path = brand_dir / "typography.json"
-    if typo_path.exists():
-        try:
-            typo = json.loads(typo_path.read_text(encoding="utf-8"))
-            font = typo.get("family", "")
-            if font:
-                parts.append(f"Font: {font}")
-        except (json.JSONDecodeError, OSError):
-            pass
+    if colors:
+        primary = colors.get("primary", "")
+        secondary = colors.get("secondary", "")
+        style_key = colors.get("style", "")
+        bg = colors.get("backgrounds", {}).get("main", "")
+        text_color = colors.get("text", {}).get("primary", "")
+        if primary:
+            parts.append(f"Primary color: {primary}")
+        if secondary:
+            parts.append(f"Accent color: {secondary}")
+        if bg:
+            parts.append(f"Background: {bg}")
+        if text_color:
+            parts.append(f"Text color: {text_color}")
+        if style_key:
+            parts.append(f"Visual style: {style_key}")
+
+    if typo:
+        font = typo.get("family", "")
+        if font:
+            parts.append(f"Font: {font}")
 
     if not parts:
         return ""
@@ -416,6 +592,74 @@ def _read_design_choices() -> str:
     )
 
 
+# ── PRD draft cache ────────────────────────────────────────────────
+# Opt-in (FORJA_PRD_CACHE=1 or FORJA_LLM_CACHE=1): regenerating from an
+# unchanged description (up to case, spacing and punctuation, see
+# _normalize_text) reuses the previous draft instead of paying for another
+# LLM round-trip.  Any change of wording is a miss: an edited idea must
+# produce a new draft.
+
+_PRD_CACHE_TTL_SECONDS = llm_cache.DEFAULT_TTL_SECONDS
+
+
+def _prd_cache_enabled() -> bool:
+    return llm_cache.enabled("FORJA_PRD_CACHE") or llm_cache.enabled()
+
+
+def _prd_cache_key(system: str, prompt: str, model: str) -> str:
+    """Return the SHA-256 hex digest identifying a PRD generation request."""
+    return llm_cache.cache_key(system, prompt, model)
+
+
+def _read_prd_cache(key: str) -> tuple[str, str] | None:
+    """Return a cached ``(prd_markdown, title)`` or None on miss / expiry."""
+    data = llm_cache.get(FORJA_DIR / "cache" / "prd", key, _PRD_CACHE_TTL_SECONDS)
+    if not isinstance(data, dict) or not data.get("md") or not data.get("title"):
+        return None
+    return data["md"], data["title"]
+
+
+def _write_prd_cache(key: str, md: str, title: str) -> None:
+    llm_cache.put(FORJA_DIR / "cache" / "prd", key, {"md": md, "title": title})
+
+
+def _llm_cache_key(system: str, prompt: str) -> str | None:
+    """Return the cache key for a plan-mode LLM request, or None when
+    FORJA_LLM_CACHE is off."""
+    if not llm_cache.enabled():
+        return None
+    from forja.config_loader import load_config
+    return llm_cache.cache_key(system, prompt, load_config().models.anthropic_model)
+
+
+def _write_prd(path: Path, text: str) -> None:
+    """Write *text* plus a trailing newline to *path* as UTF-8.
+
+    Uses one ``writev`` of the encoded text and the newline, so a large PRD
+    is not copied just to append ``"\\n"``.  Falls back to
+    ``Path.write_text`` where ``os.writev`` is unavailable (Windows).
+    """
+    if not hasattr(os, "writev"):
+        path.write_text(text + "\n", encoding="utf-8")
+        return
+    data = text.encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        written = os.writev(fd, [data, b"\n"])
+        if written < len(data) + 1:  # short write: finish the rest
+            rest = memoryview(data + b"\n")[written:]
+            while rest:
+                rest = rest[os.write(fd, rest):]
+    finally:
+        os.close(fd)
+
+
+def _echo_dim(text: str) -> None:
+    """Echo a streamed LLM chunk to stderr in dim text."""
+    sys.stderr.write(f"{DIM}{text}{RESET}")
+    sys.stderr.flush()
+
+
 def _generate_prd_from_idea(user_idea, skill="custom", context=""):
     """Call Kimi to generate a structured PRD from a project idea.
 
@@ -424,8 +668,9 @@ def _generate_prd_from_idea(user_idea, skill="custom", context=""):
     font, and visual style.
 
     When *skill* is ``'landing-page'`` or ``'api-backend'``, the
-    constraint is the **first thing** in the system prompt so the LLM
-    cannot ignore it.
+    constraint is the **first thing** in the user prompt so the LLM
+    cannot ignore it.  The system prompt only holds text that is the same
+    for every idea, static blocks first, and is sent as a cacheable prefix.
 
     Returns (prd_markdown, title) or (None, None) on failure.
     """
@@ -464,8 +709,15 @@ def _generate_prd_from_idea(user_idea, skill="custom", context=""):
     )
     prompt = "\n\n".join(prompt_parts)
 
-    # ── System message: skill constraint FIRST ──
-    system_parts: list[str] = []
+    # ── System message: stable text first so it can be prompt-cached ──
+    system_parts: list[str] = [
+        "ANTI-HALLUCINATION: Do NOT invent metrics, user counts, test coverage numbers, "
+        "deployment commands, or product capabilities. Only use data from the input. "
+        "For unknowns, write '[TBD]'. Never fabricate: npm/pip commands, "
+        "infrastructure (Docker, Terraform, K8s), security features (SSO, RBAC), "
+        "or social proof (testimonials, user counts).",
+        "You are a senior product manager. Respond only with valid JSON.",
+    ]
     if skill_constraint:
         system_parts.append(skill_constraint)
     if design_choices:
@@ -474,22 +726,30 @@ def _generate_prd_from_idea(user_idea, skill="custom", context=""):
             "The PRD MUST include these exact values in a Design section. "
             "Do NOT invent different colors, fonts, or styles."
         )
-    system_parts.append(
-        "You are a senior product manager. Respond only with valid JSON."
-    )
-    system_parts.append(
-        "ANTI-HALLUCINATION: Do NOT invent metrics, user counts, test coverage numbers, "
-        "deployment commands, or product capabilities. Only use data from the input. "
-        "For unknowns, write '[TBD]'. Never fabricate: npm/pip commands, "
-        "infrastructure (Docker, Terraform, K8s), security features (SSO, RBAC), "
-        "or social proof (testimonials, user counts)."
-    )
     system_msg = "\n\n".join(system_parts)
 
+    cache_key = None
+    if _prd_cache_enabled():
+        from forja.config_loader import load_config
+        # Everything that shapes the prompt, with the idea normalized
+        key_prompt = "\0".join(
+            (PRD_FROM_IDEA_PROMPT, _normalize_text(user_idea), design_choices, context)
+        )
+        cache_key = _prd_cache_key(system_msg, key_prompt, load_config().models.anthropic_model)
+        cached = _read_prd_cache(cache_key)
+        if cached:
+            return cached
+
+    # Stream the raw draft so the user sees progress; only the complete
+    # buffer is parsed once the call returns.
     try:
-        raw = _call_claude_code(prompt, system=system_msg)
+        raw = _call_claude_code(
+            prompt, system=system_msg, on_chunk=_echo_dim,
+        )
     except (OSError, TimeoutError, RuntimeError):
         raw = ""
+    finally:
+        sys.stderr.write("\n")
     if not raw:
         return None, None
 
@@ -510,104 +770,106 @@ def _generate_prd_from_idea(user_idea, skill="custom", context=""):
     success_metric = data.get("success_metric", "")
 
     # Build markdown
-    md = f"# {title}\n\n"
-    md += f"## Problem\n{problem}\n\n"
+    md_parts: list[str] = [f"# {title}\n\n", f"## Problem\n{problem}\n\n"]
 
     # Audience — handle both old format (string) and new format (dict)
     if isinstance(audience_data, dict):
         primary = audience_data.get("primary", "")
         roles = audience_data.get("roles", [])
         if primary:
-            md += f"## Audience\n{primary}\n\n"
+            md_parts.append(f"## Audience\n{primary}\n\n")
         if roles:
-            md += "### Audience Roles\n"
-            md += "| Role | Top Concern |\n|------|-------------|\n"
+            md_parts.append("### Audience Roles\n")
+            md_parts.append("| Role | Top Concern |\n|------|-------------|\n")
             for r in roles:
-                md += f"| {r.get('role', '')} | {r.get('top_concern', '')} |\n"
-            md += "\n"
+                md_parts.append(f"| {r.get('role', '')} | {r.get('top_concern', '')} |\n")
+            md_parts.append("\n")
     elif audience_data:
-        md += f"## Audience\n{audience_data}\n\n"
+        md_parts.append(f"## Audience\n{audience_data}\n\n")
 
     # Value Propositions
     if value_props and isinstance(value_props, dict):
-        md += "## Value Propositions\n"
+        md_parts.append("## Value Propositions\n")
         main_prop = value_props.get("main", "")
         if main_prop:
-            md += f"**Main:** {main_prop}\n\n"
+            md_parts.append(f"**Main:** {main_prop}\n\n")
         for vp in value_props.get("secondary", []):
             if isinstance(vp, dict):
-                md += f"- **{vp.get('prop', '')}**\n"
+                md_parts.append(f"- **{vp.get('prop', '')}**\n")
                 proof = vp.get("proof_point", "")
                 if proof:
-                    md += f"  - Evidence: {proof}\n"
+                    md_parts.append(f"  - Evidence: {proof}\n")
             else:
-                md += f"- {vp}\n"
-        md += "\n"
+                md_parts.append(f"- {vp}\n")
+        md_parts.append("\n")
 
     # Key Messages
     if key_messages:
-        md += "## Key Messages\n"
+        md_parts.append("## Key Messages\n")
         for msg in key_messages:
-            md += f"- {msg}\n"
-        md += "\n"
+            md_parts.append(f"- {msg}\n")
+        md_parts.append("\n")
 
     # Objection Handling
     if objections:
-        md += "## Objection Handling\n"
+        md_parts.append("## Objection Handling\n")
         for obj in objections:
             if isinstance(obj, dict):
-                md += f"- **Objection:** {obj.get('objection', '')}\n"
-                md += f"  - **Response:** {obj.get('response', '')}\n"
+                md_parts.append(f"- **Objection:** {obj.get('objection', '')}\n")
+                md_parts.append(f"  - **Response:** {obj.get('response', '')}\n")
             else:
-                md += f"- {obj}\n"
-        md += "\n"
+                md_parts.append(f"- {obj}\n")
+        md_parts.append("\n")
 
     # Competitive Positioning
     if positioning:
-        md += f"## Competitive Positioning\n{positioning}\n\n"
+        md_parts.append(f"## Competitive Positioning\n{positioning}\n\n")
 
     # Features
-    md += "## Features\n"
+    md_parts.append("## Features\n")
     for f in features:
         # Support both old format (string) and new format (dict with name/description/done_when)
         if isinstance(f, dict):
             name = f.get("name", "")
             desc = f.get("description", "")
             done = f.get("done_when", "")
-            md += f"- **{name}**: {desc}\n"
+            md_parts.append(f"- **{name}**: {desc}\n")
             if done:
-                md += f"  - ✅ Done when: {done}\n"
+                md_parts.append(f"  - ✅ Done when: {done}\n")
         else:
-            md += f"- {f}\n"
+            md_parts.append(f"- {f}\n")
 
     # Stack
-    md += "\n## Stack\n"
+    md_parts.append("\n## Stack\n")
     lang = stack.get("language", "")
     fw = stack.get("framework", "")
     db = stack.get("database", "")
     extras = stack.get("extras", [])
     rationale = stack.get("rationale", "")
     if lang and fw:
-        md += f"- {lang} + {fw}\n"
+        md_parts.append(f"- {lang} + {fw}\n")
     elif lang:
-        md += f"- {lang}\n"
+        md_parts.append(f"- {lang}\n")
     if db:
-        md += f"- {db}\n"
+        md_parts.append(f"- {db}\n")
     for ex in extras:
-        md += f"- {ex}\n"
+        md_parts.append(f"- {ex}\n")
     if rationale:
-        md += f"- Rationale: {rationale}\n"
+        md_parts.append(f"- Rationale: {rationale}\n")
     if success_metric:
-        md += f"\n## Success Metric\n{success_metric}\n"
-    md += "\n## Out of Scope\n"
+        md_parts.append(f"\n## Success Metric\n{success_metric}\n")
+    md_parts.append("\n## Out of Scope\n")
     for item in out_of_scope:
-        md += f"- {item}\n"
+        md_parts.append(f"- {item}\n")
 
     # Append design choices so they survive in the PRD on disk
     if design_choices:
-        md += f"\n## Design\n{design_choices}\n"
+        md_parts.append(f"\n## Design\n{design_choices}\n")
 
-    return md.strip(), title
+    md = "".join(md_parts).strip()
+    if cache_key:
+        _write_prd_cache(cache_key, md, title)
+    return md, title
 
 
 def _scratch_flow(
@@ -675,8 +937,7 @@ def _scratch_flow(
         print()
         print(f"  {BOLD}Here's your initial PRD:{RESET}")
         print(f"  {'─' * 50}")
-        for line in prd_content.splitlines():
-            print(f"  {line}")
+        _print_indented(prd_content)
         print(f"  {'─' * 50}")
         print()
 
@@ -728,47 +989,86 @@ def _scratch_flow(
 
 # ── Context gathering ───────────────────────────────────────────────
 
+def _scan_files(directory: Path, suffix: str) -> list[str]:
+    """Return sorted paths of regular files in *directory* ending in *suffix*."""
+    try:
+        with os.scandir(directory) as it:
+            return sorted(e.path for e in it if e.name.endswith(suffix) and e.is_file())
+    except OSError:
+        return []
+
+
 def _gather_context() -> str:
-    """Read all available context from context/ directory."""
-    parts: list[str] = []
+    """Read all available context from context/ directory.
+
+    Not memoized: plan mode reads it once per run, and a signature of
+    every file under these trees would cost about as much as the read.
+    """
+    # The three sources are independent; overlap their file I/O.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        store = pool.submit(_read_store_decisions, STORE_DIR)
+        learnings = pool.submit(_read_learnings, LEARNINGS_DIR)
+        # Business context: company, domains, design-system (shared utility)
+        biz = pool.submit(gather_context, CONTEXT_DIR, 3000)
+        parts = store.result() + learnings.result()
+        biz_text = biz.result()
+    if biz_text:
+        parts.append(biz_text)
+    return "\n".join(parts) if parts else "No prior context available."
+
+
+def _read_store_decisions(store_dir: Path) -> list[str]:
+    """Return ``[decision] key: value`` lines from context/store/*.json."""
+    paths = _scan_files(store_dir, ".json")
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+            entries = list(pool.map(safe_read_json, map(Path, paths)))
+    else:
+        entries = [safe_read_json(Path(p)) for p in paths]
 
-    # context/store/*.json
-    for fpath in sorted(glob_mod.glob(str(STORE_DIR / "*.json"))):
-        data = safe_read_json(Path(fpath))
+    parts: list[str] = []
+    for fpath, data in zip(paths, entries):
         if data is None:
             continue
-        key = data.get("key", Path(fpath).stem)
+        # Default to the file name without ".json" (only built when needed)
+        key = data["key"] if "key" in data else os.path.basename(fpath)[:-5]
         value = data.get("value", "")
         if key and value:
             parts.append(f"[decision] {key}: {value}")
+    return parts
+
 
-    # context/learnings/*.jsonl
+def _read_learnings(learnings_dir: Path) -> list[str]:
+    """Return ``[learning]`` lines from context/learnings/*.jsonl.
+
+    Files are read in order and reading stops once the 2000-char budget
+    is spent, so this part stays sequential.
+    """
+    parts: list[str] = []
     total_chars = 0
-    for fpath in sorted(glob_mod.glob(str(LEARNINGS_DIR / "*.jsonl"))):
+    for fpath in _scan_files(learnings_dir, ".jsonl"):
         try:
-            for line in Path(fpath).read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
+            # Iterate raw byte lines so a large file is only read up to the
+            # budget; json.loads decodes the UTF-8 itself.
+            with open(fpath, "rb", buffering=65536) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                        logger.debug("Malformed JSONL line in %s: %s", fpath, exc)
+                        continue
                     text = entry.get("learning", entry.get("text", entry.get("content", "")))
                     if text:
                         if total_chars + len(text) > 2000:
-                            break
+                            return parts
                         parts.append(f"[learning] {text}")
                         total_chars += len(text)
-                except json.JSONDecodeError as exc:
-                    logger.debug("Malformed JSONL line in %s: %s", fpath, exc)
         except OSError as exc:
             logger.debug("Could not read learnings file %s: %s", fpath, exc)
-
-    # Business context: company, domains, design-system (shared utility)
-    biz = gather_context(CONTEXT_DIR, max_chars=3000)
-    if biz:
-        parts.append(biz)
-
-    return "\n".join(parts) if parts else "No prior context available."
+    return parts
 
 
 # ── Expert panel prompts (Round 1: WHAT, Round 2: HOW) ─────────────
@@ -832,28 +1132,28 @@ HOW_PANEL_PROMPT = (
     + _PANEL_JSON_SCHEMA
 )
 
-FALLBACK_WHAT_EXPERTS = [
+FALLBACK_WHAT_EXPERTS: tuple[dict, ...] = (
     {"name": "Product Strategist", "field": "Product Strategy", "perspective": "Evaluating viability, user flows, and product-market fit."},
     {"name": "Target Audience Expert", "field": "User Research", "perspective": "Evaluating who the user is and what they actually need."},
     {"name": "Domain Expert", "field": "Industry Context", "perspective": "Evaluating competitive positioning and domain best practices."},
-]
+)
 
-FALLBACK_WHAT_QUESTIONS = [
+FALLBACK_WHAT_QUESTIONS: tuple[dict, ...] = (
     {"id": 1, "expert_name": "Target Audience Expert", "question": "Who is the primary user and what problem are they trying to solve?", "why": "Without this, the team optimizes for the wrong user.", "default": "Individual developer, solving productivity pain."},
     {"id": 2, "expert_name": "Target Audience Expert", "question": "What does the user see and feel when they first use this?", "why": "First impression determines retention.", "default": "Clean, fast, no-signup-required first interaction."},
     {"id": 3, "expert_name": "Product Strategist", "question": "What are the key sections, pages, or endpoints?", "why": "Defines MVP scope and build order.", "default": "3-5 core pages/endpoints that deliver the main value."},
     {"id": 4, "expert_name": "Product Strategist", "question": "What does success look like? What metric or outcome?", "why": "Without a goal, there is no way to measure if it works.", "default": "User completes the core flow end-to-end in under 2 minutes."},
     {"id": 5, "expert_name": "Domain Expert", "question": "What are the key messages or value propositions?", "why": "Messaging drives conversion and retention.", "default": "Simple, fast, focused on one thing done well."},
     {"id": 6, "expert_name": "Domain Expert", "question": "What competitive alternatives exist and how is this different?", "why": "Positioning determines feature priority.", "default": "Simpler and more focused than existing tools."},
-]
+)
 
-FALLBACK_HOW_EXPERTS = [
+FALLBACK_HOW_EXPERTS: tuple[dict, ...] = (
     dict(TECHNICAL_EXPERT),
     {"name": "Stack Specialist", "field": "Framework & Library Selection", "perspective": "Choosing the right tools for the job within build constraints."},
     {"name": "Security & Performance Engineer", "field": "Security & Performance", "perspective": "Evaluating attack surface, data handling, and runtime performance."},
-]
+)
 
-FALLBACK_HOW_QUESTIONS = [
+FALLBACK_HOW_QUESTIONS: tuple[dict, ...] = (
     {"id": 1, "expert_name": "Build Feasibility Engineer", "question": "STACK OVERRIDE CHECK: Does the PRD specify any technology Claude Code cannot install?", "why": "Claude Code can only install via pip/npm. Redis, PostgreSQL, Docker are impossible.", "default": "Python + FastAPI + SQLite (single-process, pip-installable, no Docker)."},
     {"id": 2, "expert_name": "Build Feasibility Engineer", "question": "What external dependencies are needed and are they all pip/npm installable?", "why": "Any system-level dependency will break the autonomous build.", "default": "All deps via pip. No system packages, no Docker, no external databases."},
     {"id": 3, "expert_name": "Build Feasibility Engineer", "question": "What scope limitations should we set so Claude Code can finish in one session?", "why": "Overly ambitious PRDs result in half-built projects.", "default": "MVP only: 3-5 endpoints or pages, no auth for v1, no CI/CD."},
@@ -861,7 +1161,7 @@ FALLBACK_HOW_QUESTIONS = [
     {"id": 5, "expert_name": "Stack Specialist", "question": "What is the expected data volume and storage approach?", "why": "Determines if SQLite is sufficient or if we need creative alternatives.", "default": "MVP: <1000 users, <100K records. SQLite is sufficient."},
     {"id": 6, "expert_name": "Security & Performance Engineer", "question": "What authentication and authorization model is needed?", "why": "Auth affects every endpoint and must be designed upfront.", "default": "JWT tokens for API auth. No auth for MVP landing pages."},
     {"id": 7, "expert_name": "Security & Performance Engineer", "question": "What are the input validation and size limits?", "why": "Without limits, someone uploads 1GB in a text field.", "default": "Title: max 255 chars. Content: max 50KB. Body: max 100KB."},
-]
+)
 
 
 # ── Technical expert guard ──────────────────────────────────────────
@@ -870,6 +1170,10 @@ _TECH_KEYWORDS = frozenset({
     "architect", "engineer", "infrastructure", "backend", "build",
     "devops", "system", "technical", "stack", "feasibility", "runtime",
 })
+# Whole whitespace-delimited tokens only, matching the old split() test.
+_TECH_KEYWORDS_RE = re.compile(
+    r"(?<!\S)(?:" + "|".join(sorted(_TECH_KEYWORDS)) + r")(?!\S)", re.IGNORECASE,
+)
 
 
 def _ensure_technical_expert(
@@ -882,8 +1186,8 @@ def _ensure_technical_expert(
     :data:`TECHNICAL_QUESTIONS` are appended with sequential IDs.
     """
     has_tech = any(
-        _TECH_KEYWORDS & set(e.get("field", "").lower().split())
-        or _TECH_KEYWORDS & set(e.get("name", "").lower().split())
+        _TECH_KEYWORDS_RE.search(e.get("field", ""))
+        or _TECH_KEYWORDS_RE.search(e.get("name", ""))
         for e in experts
     )
     if has_tech:
@@ -895,11 +1199,26 @@ def _ensure_technical_expert(
     else:
         experts.append(TECHNICAL_EXPERT)
 
+    _append_numbered(questions, TECHNICAL_QUESTIONS)
+    return experts, questions
+
+
+def _append_numbered(questions: list[dict], extra) -> None:
+    """Append copies of *extra* to *questions* with IDs after the highest one.
+
+    The panel's IDs come from the LLM and need not be sorted, so the
+    highest is found by a scan rather than read off the last question.
+    """
     next_id = max((q.get("id", 0) for q in questions), default=0) + 1
-    for i, tq in enumerate(TECHNICAL_QUESTIONS):
-        questions.append({**tq, "id": next_id + i})
+    questions.extend({**q, "id": next_id + i} for i, q in enumerate(extra))
 
-    return experts, questions
+
+# Substrings that mark a PRD as describing a UI project (single-pass scan).
+_UI_KEYWORDS = (
+    "frontend", "ui", "web", "landing", "dashboard", "game", "mobile",
+    "react", "html", "css", "canvas", "drag", "drop", "theme", "responsive",
+)
+_UI_KEYWORDS_RE = re.compile("|".join(map(re.escape, _UI_KEYWORDS)), re.IGNORECASE)
 
 
 def _ensure_design_expert(
@@ -909,14 +1228,10 @@ def _ensure_design_expert(
 
     Returns ``(experts, questions)`` — mirrors :func:`_ensure_technical_expert`.
     """
-    ui_keywords = [
-        "frontend", "ui", "web", "landing", "dashboard", "game", "mobile",
-        "react", "html", "css", "canvas", "drag", "drop", "theme", "responsive",
-    ]
-    has_ui = any(kw in prd_text.lower() for kw in ui_keywords)
+    has_ui = _UI_KEYWORDS_RE.search(prd_text) is not None
     has_design = any(
-        "design" in e.get("field", "").lower() or "ux" in e.get("field", "").lower()
-        for e in experts
+        "design" in field or "ux" in field
+        for field in (e.get("field", "").lower() for e in experts)
     )
     if has_ui and not has_design:
         experts.insert(1, {
@@ -924,9 +1239,7 @@ def _ensure_design_expert(
             "field": "UX Design & Visual Systems",
             "perspective": "Accessible, consistent, performant interfaces",
         })
-        next_id = max((q.get("id", 0) for q in questions), default=0) + 1
-        for i, dq in enumerate(DESIGN_QUESTIONS):
-            questions.append({**dq, "id": next_id + i})
+        _append_numbered(questions, DESIGN_QUESTIONS)
     return experts, questions
 
 
@@ -949,40 +1262,127 @@ def _deduplicate_experts(experts: list[dict]) -> list[dict]:
 
 # ── Core flow ───────────────────────────────────────────────────────
 
-def _get_expert_color(expert_name, experts):
-    """Get consistent color for an expert."""
+def _expert_color_map(experts) -> dict[str, str]:
+    """Map each expert name to its panel color (first occurrence wins)."""
+    color_map: dict[str, str] = {}
     for i, exp in enumerate(experts):
-        if exp.get("name") == expert_name:
-            return EXPERT_COLORS[i % len(EXPERT_COLORS)]
-    return DIM
+        color_map.setdefault(exp.get("name"), EXPERT_COLORS[i % len(EXPERT_COLORS)])
+    return color_map
+
+
+def _print_indented(text: str, prefix: str = "  ", suffix: str = "") -> None:
+    """Print *text* with *prefix*/*suffix* around every line in a single write."""
+    lines = text.splitlines()
+    if lines:
+        # Joining on suffix+newline+prefix formats nothing per line
+        print(prefix + f"{suffix}\n{prefix}".join(lines) + suffix)
+
+
+def _print_preview(text: str, max_lines: int) -> None:
+    """Print the first *max_lines* of *text*, indented, noting what was cut.
+
+    Everything, including the "more lines" note, goes out in a single write.
+    """
+    lines = text.strip().splitlines()
+    out = "\n  ".join(lines[:max_lines])
+    if len(lines) > max_lines:
+        out += "\n" + _MORE_LINES_FMT.format(len(lines) - max_lines)
+    if lines:
+        print(f"  {out}")
+
+
+class _StreamPreview:
+    """``on_chunk`` callback that prints a streamed PRD as its preview.
+
+    Complete lines are printed indented as they arrive, up to *max_lines*
+    (an opening code fence is dropped, as :func:`_strip_fence` would).
+    :meth:`finish` completes the preview from the final text, or prints
+    it whole when nothing was streamed (cache hit, LLM failure) or the
+    final text is not what was streamed (a call that failed midway).
+    """
+
+    def __init__(self, max_lines: int) -> None:
+        self.max_lines = max_lines
+        self.printed = 0
+        self.streamed = False
+        self._partial = ""
+        self._shown: list[str] = []
+
+    def __call__(self, chunk: str) -> None:
+        self.streamed = True
+        if self.printed >= self.max_lines:
+            return
+        *complete, self._partial = (self._partial + chunk).split("\n")
+        out = []
+        for line in complete:
+            if self.printed >= self.max_lines:
+                break
+            if not self.printed and (not line.strip() or line.startswith("```")):
+                continue  # leading blank lines / opening fence
+            out.append(f"  {line}\n")
+            self._shown.append(line)
+            self.printed += 1
+        if out:
+            sys.stdout.write("".join(out))
+            sys.stdout.flush()
+
+    def finish(self, text: str) -> None:
+        if not self.streamed:
+            _print_preview(text, self.max_lines)
+            return
+        if not text.strip().startswith("\n".join(self._shown)):
+            print(f"  {DIM}(stream interrupted, final version:){RESET}")
+            _print_preview(text, self.max_lines)
+            return
+        if self._partial.strip() and not self._partial.startswith("```") \
+                and self.printed < self.max_lines:
+            print(f"  {self._partial}")
+            self.printed += 1
+        # Only the count is needed here: no need to split the whole PRD
+        body = text.strip()
+        total = body.count("\n") + 1 if body else 0
+        if total > self.printed:
+            print(_MORE_LINES_FMT.format(total - self.printed))
 
 
 def _print_header(prd_title, experts, assessment):
-    """Print the plan mode header with expert panel."""
-    print()
-    print(f"{BOLD}  ── Forja Plan Mode ──{RESET}")
-    print(f"  {DIM}PRD: {prd_title}{RESET}")
-    print()
-    print(f"  {BOLD}Expert Panel:{RESET}")
-    for i, exp in enumerate(experts):
-        color = EXPERT_COLORS[i % len(EXPERT_COLORS)]
-        print(f"    {color}{exp['name']}{RESET} — {exp['field']}")
-    print()
-    print(f"  {DIM}{assessment}{RESET}")
-    print()
+    """Print the plan mode header with expert panel in a single write."""
+    lines = [
+        "",
+        f"{BOLD}  ── Forja Plan Mode ──{RESET}",
+        f"  {DIM}PRD: {prd_title}{RESET}",
+        "",
+        f"  {BOLD}Expert Panel:{RESET}",
+    ]
+    lines.extend(
+        f"    {EXPERT_COLORS[i % len(EXPERT_COLORS)]}{exp['name']}{RESET} — {exp['field']}"
+        for i, exp in enumerate(experts)
+    )
+    lines += ["", f"  {DIM}{assessment}{RESET}", ""]
+    print("\n".join(lines))
 
 
-def _ask_question(q, experts, prd_summary, research_log=None, total=8, auto_mode=False):
+# Separates several topics in one ``research`` command.
+_TOPIC_SEP = ";;"
+
+
+def _ask_question(q, experts, prd_summary, research_log=None, total=8, auto_mode=False,
+                  color_map=None):
     """Present a question and get user response. Returns (answer, tag).
 
     *research_log*, when provided, accumulates ``{"topic": ..., "findings": ...}``
     dicts for every successful research call made during this question.
     *total* is the total number of questions in this round (for display).
     *auto_mode*: when True, accepts all defaults without prompting the user.
+    *color_map*: precomputed :func:`_expert_color_map` for *experts*.
+    A topic researched again is served by :func:`_lookup_research` and is
+    not logged twice.
     """
+    if color_map is None:
+        color_map = _expert_color_map(experts)
     expert = q["expert_name"]
     qid = q["id"]
-    color = _get_expert_color(expert, experts)
+    color = color_map.get(expert, DIM)
     question = q["question"]
     why = q["why"]
     default = q["default"]
@@ -990,7 +1390,7 @@ def _ask_question(q, experts, prd_summary, research_log=None, total=8, auto_mode
     print(f"  {color}{BOLD}[{expert} — {qid}/{total}]{RESET} {question}")
     print(f"  {DIM}Why it matters: \"{why}\"{RESET}")
     print(f"  {DIM}Suggestion: {default}{RESET}")
-    print(f"  {DIM}Enter=accept | skip | research [topic] | done{RESET}")
+    print(f"  {DIM}Enter=accept | skip | research [topic] (;; between several) | done{RESET}")
     print()
 
     if auto_mode:
@@ -1010,19 +1410,28 @@ def _ask_question(q, experts, prd_summary, research_log=None, total=8, auto_mode
             print(f"  {GREEN}✔ Accepted{RESET}")
             return default, "ACCEPTED"
 
-        if answer.lower() == "skip":
+        command = answer.lower()
+        if command == "skip":
             print(f"  {DIM}→ Using default{RESET}")
             return default, "SKIPPED"
 
-        if answer.lower() == "done":
+        if command == "done":
             return None, "DONE"
 
-        if answer.lower().startswith("research "):
-            topic = answer[9:].strip()
-            if topic:
-                findings = _do_research(expert, topic, prd_summary, experts)
-                if findings and research_log is not None:
-                    research_log.append({"topic": topic, "findings": findings})
+        if command.startswith("research "):
+            # One topic, or several separated by ";;" (researched concurrently);
+            # a single ";" stays part of the topic
+            topics = [t.strip() for t in answer[9:].split(_TOPIC_SEP) if t.strip()]
+            if topics:
+                all_findings = _do_research_many(
+                    expert, topics, prd_summary, experts, color_map=color_map,
+                )
+                if research_log is not None:
+                    logged = {_normalize_text(r["topic"]) for r in research_log}
+                    for topic, findings in zip(topics, all_findings):
+                        if findings and _normalize_text(topic) not in logged:
+                            logged.add(_normalize_text(topic))
+                            research_log.append({"topic": topic, "findings": findings})
                 # Re-show question
                 print()
                 print(f"  {color}{BOLD}[{expert} — {qid}/{total}]{RESET} {question}")
@@ -1041,7 +1450,75 @@ def _do_research(expert_name, topic, prd_summary, experts=None):
     Returns the research findings as a string, or empty string on failure.
     Saves findings to ``.forja/research/`` for future reference.
     """
-    color = _get_expert_color(expert_name, experts) if experts else DIM
+    return _do_research_many(expert_name, [topic], prd_summary, experts)[0]
+
+
+# Answers in a batched research reply are tagged "[1] ...", "[2] ..." at
+# the start of a line.
+_INDEX_TAG_RE = re.compile(r"^\[(\d+)\]\s*", re.M)
+
+
+def _research_without_web(expert_name, topics, prd_summary):
+    """Answer *topics* from expert knowledge alone, without web search.
+
+    Several topics are asked in one batched prompt and split on their
+    ``[i]`` tags. Topics missing from that reply get their own calls,
+    run concurrently.
+    Returns raw answers in *topics* order (empty string on failure).
+    """
+    system = f"You are {expert_name}, a domain expert. Answer concisely with concrete data and a clear recommendation."
+
+    def _ask(prompt):
+        try:
+            return _call_claude_code(prompt, system=system) or ""
+        except (OSError, TimeoutError, RuntimeError):
+            return ""
+
+    def _ask_one(topic):
+        return _ask(
+            f"The project context: {prd_summary}\n\n"
+            f"Research topic: {topic}\n\n"
+            f"Respond as {expert_name} would: with specific data, benchmarks, "
+            f"and a concrete recommendation. Keep it under 200 words."
+        )
+
+    def _ask_each(topics):
+        # Independent calls, so run them concurrently like the web searches
+        if len(topics) <= 1:
+            return [_ask_one(topic) for topic in topics]
+        with ThreadPoolExecutor(max_workers=min(_RESEARCH_MAX_WORKERS, len(topics))) as pool:
+            return list(pool.map(_ask_one, topics))
+
+    if len(topics) < 2:
+        return _ask_each(topics)
+
+    numbered = "\n".join(f"[{i}] {topic}" for i, topic in enumerate(topics, 1))
+    raw = _ask(
+        f"The project context: {prd_summary}\n\n"
+        f"Research topics:\n{numbered}\n\n"
+        f"Respond as {expert_name} would: with specific data, benchmarks, "
+        f"and a concrete recommendation for each topic. Keep each under 200 words. "
+        f"Start each answer on its own line with the topic's tag, e.g. [1]."
+    )
+    answers: dict[int, str] = {}
+    parts = _INDEX_TAG_RE.split(raw)
+    for idx, text in zip(parts[1::2], parts[2::2]):
+        answers.setdefault(int(idx), text.strip())
+    retry = [topic for i, topic in enumerate(topics, 1) if not answers.get(i)]
+    retried = iter(_ask_each(retry))
+    return [answers.get(i) or next(retried) for i in range(1, len(topics) + 1)]
+
+
+def _do_research_many(expert_name, topics, prd_summary, experts=None, color_map=None):
+    """Research several topics for one expert, running the web searches concurrently.
+
+    Returns a list of findings strings (empty string on failure) in the
+    same order as *topics*. Each topic falls back to expert knowledge on
+    its own when web search fails.
+    """
+    if color_map is None:
+        color_map = _expert_color_map(experts or [])
+    color = color_map.get(expert_name, DIM)
     # Find expert field
     expert_field = ""
     if experts:
@@ -1050,58 +1527,114 @@ def _do_research(expert_name, topic, prd_summary, experts=None):
                 expert_field = exp.get("field", "")
                 break
 
-    print(f"\n  {DIM}Researching: {topic}...{RESET}")
+    print("".join(f"\n  {DIM}Researching: {topic}...{RESET}" for topic in topics))
 
-    findings = ""
+    # Primary: Claude with web search, all topics in flight at once
+    web_results = _call_claude_research_many(
+        [(expert_name, expert_field, topic, prd_summary) for topic in topics]
+    )
 
-    # Primary: Claude with web search
-    raw = _call_claude_research(expert_name, expert_field, topic, prd_summary)
-    if raw:
-        findings = raw.strip()
-        print(f"  {DIM}(web search via Claude){RESET}")
-        print()
-        for line in findings.splitlines():
-            print(f"  {color}  {line}{RESET}")
-        print()
-    else:
-        # Fallback: any provider without web search
-        print(f"  {YELLOW}Web search unavailable, using expert knowledge only{RESET}")
-        try:
-            raw = _call_claude_code(
-                f"The project context: {prd_summary}\n\n"
-                f"Research topic: {topic}\n\n"
-                f"Respond as {expert_name} would: with specific data, benchmarks, "
-                f"and a concrete recommendation. Keep it under 200 words.",
-                system=f"You are {expert_name}, a domain expert. Answer concisely with concrete data and a clear recommendation.",
-            )
-        except (OSError, TimeoutError, RuntimeError):
-            raw = ""
+    # Fallback: any provider without web search, one call for every topic
+    # web search could not answer
+    missing = [topic for topic, raw in zip(topics, web_results) if not raw]
+    fallback = dict(zip(missing, _research_without_web(expert_name, missing, prd_summary)))
+
+    results: list[str] = []
+    for topic, raw in zip(topics, web_results):
+        findings = ""
+        if len(topics) > 1:
+            print(f"\n  {BOLD}{topic}{RESET}")
         if raw:
             findings = raw.strip()
+            print(f"  {DIM}(web search via Claude){RESET}")
             print()
-            for line in findings.splitlines():
-                print(f"  {color}  {line}{RESET}")
+            _print_indented(findings, prefix=f"  {color}  ", suffix=RESET)
             print()
         else:
-            print(f"  {RED}Could not research (no model available){RESET}")
+            print(f"  {YELLOW}Web search unavailable, using expert knowledge only{RESET}")
+            raw = fallback.get(topic, "")
+            if raw:
+                findings = raw.strip()
+                print()
+                _print_indented(findings, prefix=f"  {color}  ", suffix=RESET)
+                print()
+            else:
+                print(f"  {RED}Could not research (no model available){RESET}")
+
+        # Save to .forja/research/ for future reference
+        if findings:
+            _save_research(topic, findings)
+        results.append(findings)
+
+    return results
+
+
+# Single background writer so persisting research never delays the next
+# question; writes stay in submission order.
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="forja-io")
+_pending_writes: list[Future] = []
+
+
+def _write_in_background(path: Path, text: str) -> None:
+    """Queue ``path.write_text(text)`` (creating parent dirs) on the I/O thread."""
+    path = path.absolute()  # pin against later cwd changes
 
-    # Save to .forja/research/ for future reference
-    if findings:
-        _save_research(topic, findings)
+    def _write() -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
 
-    return findings
+    _pending_writes.append(_IO_POOL.submit(_write))
+
+
+def _flush_pending_writes() -> None:
+    """Block until every queued background write has finished."""
+    while _pending_writes:
+        try:
+            _pending_writes.pop(0).result()
+        except OSError as exc:
+            logger.debug("Background write failed: %s", exc)
+
+
+# Any character that is not alphanumeric or "-" (``\w`` also admits "_",
+# which is excluded explicitly). Matches ``str.isalnum`` for all of Unicode.
+_SLUG_RE = re.compile(r"[^\w-]|_")
 
 
 def _save_research(topic: str, findings: str) -> None:
-    """Persist research findings to .forja/research/ directory."""
-    research_dir = FORJA_DIR / "research"
-    research_dir.mkdir(parents=True, exist_ok=True)
-    slug = "".join(c if c.isalnum() or c == "-" else "-" for c in topic.lower())[:80]
-    fpath = research_dir / f"{slug}.md"
-    fpath.write_text(f"# Research: {topic}\n\n{findings}\n", encoding="utf-8")
+    """Persist research findings to .forja/research/ directory (in the background)."""
+    slug = _SLUG_RE.sub("-", topic.lower())[:80]
+    fpath = FORJA_DIR / "research" / f"{slug}.md"
+    _write_in_background(fpath, f"# Research: {topic}\n\n{findings}\n")
     print(f"  {DIM}Saved: {fpath}{RESET}")
 
 
+_DEFAULT_COLORS_TEXT = (
+    "# Color Palette\n\n"
+    "- Primary: #2563eb (blue)\n"
+    "- Secondary: #1e293b (dark slate)\n"
+    "- Accent: #22c55e (green)\n"
+    "- Background: #f8fafc (light) / #0f172a (dark)\n"
+    "- Text: #1e293b (light mode) / #f1f5f9 (dark mode)\n"
+)
+
+
+def _design_style_text(style: str) -> str:
+    return (
+        f"# Design Style\n\nStyle: {style}\n\n"
+        f"## Guidelines\n"
+        f"- Clean spacing, generous whitespace\n"
+        f"- Consistent border-radius (8px default)\n"
+        f"- System font stack for performance\n"
+        f"- Responsive: mobile-first, breakpoints at 640px, 768px, 1024px\n"
+    )
+
+
+# What _collect_design_context returns when the user skips every question
+_DEFAULT_DESIGN_CONTEXT = "\n\n".join(
+    (_DEFAULT_COLORS_TEXT.strip(), _design_style_text("minimal").strip())
+)
+
+
 def _collect_design_context() -> str:
     """Ask the user 3 optional design questions and write context files.
 
@@ -1119,10 +1652,16 @@ def _collect_design_context() -> str:
     except (EOFError, KeyboardInterrupt):
         print()
         ref = ""
+    ref_path = design_dir / "references.md"
     if ref:
-        (design_dir / "references.md").write_text(
-            f"# Visual References\n\n- {ref}\n", encoding="utf-8",
-        )
+        ref_text = f"# Visual References\n\n- {ref}\n"
+        ref_path.write_text(ref_text, encoding="utf-8")
+    else:
+        # Keep references saved by an earlier run
+        try:
+            ref_text = ref_path.read_text(encoding="utf-8")
+        except OSError:
+            ref_text = ""
 
     _flush_stdin()
     try:
@@ -1130,20 +1669,8 @@ def _collect_design_context() -> str:
     except (EOFError, KeyboardInterrupt):
         print()
         colors = ""
-    if colors:
-        (design_dir / "colors.md").write_text(
-            f"# Color Palette\n\n{colors}\n", encoding="utf-8",
-        )
-    else:
-        (design_dir / "colors.md").write_text(
-            "# Color Palette\n\n"
-            "- Primary: #2563eb (blue)\n"
-            "- Secondary: #1e293b (dark slate)\n"
-            "- Accent: #22c55e (green)\n"
-            "- Background: #f8fafc (light) / #0f172a (dark)\n"
-            "- Text: #1e293b (light mode) / #f1f5f9 (dark mode)\n",
-            encoding="utf-8",
-        )
+    colors_text = f"# Color Palette\n\n{colors}\n" if colors else _DEFAULT_COLORS_TEXT
+    (design_dir / "colors.md").write_text(colors_text, encoding="utf-8")
 
     _flush_stdin()
     try:
@@ -1151,45 +1678,50 @@ def _collect_design_context() -> str:
     except (EOFError, KeyboardInterrupt):
         print()
         style = ""
-    if not style:
-        style = "minimal"
-    (design_dir / "style.md").write_text(
-        f"# Design Style\n\nStyle: {style}\n\n"
-        f"## Guidelines\n"
-        f"- Clean spacing, generous whitespace\n"
-        f"- Consistent border-radius (8px default)\n"
-        f"- System font stack for performance\n"
-        f"- Responsive: mobile-first, breakpoints at 640px, 768px, 1024px\n",
-        encoding="utf-8",
-    )
+    style_text = _design_style_text(style or "minimal")
+    (design_dir / "style.md").write_text(style_text, encoding="utf-8")
+
+    # Build the context string from what was just written (no read-back)
+    parts = [t.strip() for t in (ref_text, colors_text, style_text) if t.strip()]
+    return "\n\n".join(parts)
 
-    # Read back all design files to build context string
-    parts: list[str] = []
-    for fname in ("references.md", "colors.md", "style.md"):
-        fpath = design_dir / fname
-        if fpath.exists():
-            text = fpath.read_text(encoding="utf-8").strip()
-            if text:
-                parts.append(text)
 
-    return "\n\n".join(parts) if parts else ""
+# Opening fence (with optional language tag) up to the last closing fence.
+_FENCE_RE = re.compile(r"\A```[^\n]*\n(.*)```", re.S)
 
 
-def _generate_enriched_prd(prd_content, qa_transcript, experts, design_context="", research_log=None, skill="custom"):
+def _strip_fence(text: str) -> str:
+    """Strip surrounding whitespace and a markdown code fence, if any."""
+    text = text.strip()
+    m = _FENCE_RE.match(text)
+    return m.group(1).strip() if m else text
+
+
+def _only_defaults(transcript: list[dict]) -> bool:
+    """Return True when every answer in *transcript* is a suggested default
+    (skipped, or accepted with Enter / by auto mode)."""
+    return all(a.get("tag") in ("SKIPPED", "ACCEPTED") for a in transcript)
+
+
+def _generate_enriched_prd(prd_content, qa_transcript, experts, design_context="", research_log=None, skill="custom",
+                           on_chunk=None):
     """Call Kimi to generate the enriched PRD.
 
     When *skill* is ``'landing-page'``, the section headings are adapted
     so the LLM doesn't hallucinate backend architecture for a static page.
+    *on_chunk* receives the response as it streams; by default it is
+    echoed to stderr.
     """
     # Format Q&A transcript
-    transcript_text = ""
+    transcript_parts: list[str] = []
     for item in qa_transcript:
         tag = item.get("tag", "DECISION")
         expert = item.get("expert", item.get("expert_name", "Expert"))
-        transcript_text += (
+        transcript_parts.append(
             f"[{tag}] {expert}: {item['question']}\n"
             f"  Answer: {item['answer']}\n\n"
         )
+    transcript_text = "".join(transcript_parts)
 
     experts_text = ", ".join(f"{e['name']} ({e['field']})" for e in experts)
 
@@ -1245,42 +1777,100 @@ def _generate_enriched_prd(prd_content, qa_transcript, experts, design_context="
         "URLs, user counts, or infrastructure."
     )
     if skill_constraint:
-        system_msg = skill_constraint + "\n\n" + system_msg
+        # Appended after the shared instructions so every skill keeps the
+        # same cacheable prefix.
+        system_msg = system_msg + "\n\n" + skill_constraint
+
+    # The original PRD leads as a cacheable prefix; the answers and
+    # instructions that follow change with every round.
+    prd_prefix = f"Original PRD:\n{prd_content}\n\n"
+    prompt = (
+        f"The experts ({experts_text}) have received the user's answers. "
+        f"Generate the enriched PRD.\n\n"
+        f"Experts and their questions/answers:\n{transcript_text}\n"
+        f"Generate a complete PRD that incorporates all answers. Structure:\n"
+        f"{sections_text}"
+        f"{design_section}"
+        f"{research_section}\n\n"
+        f"IMPORTANT: Do NOT add information that was not in the original PRD or "
+        f"the expert Q&A. Do NOT invent commands, URLs, metrics, or claims.\n\n"
+        f"Respond ONLY with the complete PRD in markdown."
+    )
+    cache_dir = FORJA_DIR / "cache" / "enriched"
+    cache_key = _llm_cache_key(system_msg, prd_prefix + prompt)
+    if cache_key:
+        cached = llm_cache.get(cache_dir, cache_key)
+        if isinstance(cached, str) and cached:
+            return cached
 
     try:
         raw = _call_claude_code(
-            f"The experts ({experts_text}) have received the user's answers. "
-            f"Generate the enriched PRD.\n\n"
-            f"Experts and their questions/answers:\n{transcript_text}\n"
-            f"Original PRD:\n{prd_content}\n\n"
-            f"Generate a complete PRD that incorporates all answers. Structure:\n"
-            f"{sections_text}"
-            f"{design_section}"
-            f"{research_section}\n\n"
-            f"IMPORTANT: Do NOT add information that was not in the original PRD or "
-            f"the expert Q&A. Do NOT invent commands, URLs, metrics, or claims.\n\n"
-            f"Respond ONLY with the complete PRD in markdown.",
-            system=system_msg,
-            timeout=180,
+            prompt, system=system_msg, timeout=180, on_chunk=on_chunk or _echo_dim,
+            cache_prefix=prd_prefix,
         )
     except (OSError, TimeoutError, RuntimeError):
         raw = ""
+    finally:
+        if on_chunk is None:
+            sys.stderr.write("\n")
     if raw:
-        # Strip markdown wrappers if present
-        text = raw.strip()
-        if text.startswith("```"):
-            first_nl = text.find("\n")
-            last_fence = text.rfind("```")
-            if first_nl != -1 and last_fence > first_nl:
-                text = text[first_nl + 1:last_fence].strip()
+        text = _strip_fence(raw)
+        if cache_key and text:
+            llm_cache.put(cache_dir, cache_key, text)
         return text
     return None
 
 
+# ── PRD edit memo ───────────────────────────────────────────────────
+# Re-applying the same feedback to the same PRD text (e.g. after an undo)
+# reuses the earlier LLM result instead of paying for another round-trip.
+# Cleared once the user accepts the PRD; with FORJA_LLM_CACHE=1 results
+# also persist on disk across sessions.
+
+_PRD_EDIT_CACHE_SIZE = 32
+_prd_edit_cache: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+
+
+def _prd_edit_key(kind: str, prd_text: str, feedback: str) -> tuple[str, str, str]:
+    return (kind, hashlib.sha256(prd_text.encode("utf-8")).hexdigest(), feedback)
+
+
+def _prd_edit_disk_key(key: tuple[str, str, str]) -> str | None:
+    kind, prd_hash, feedback = key
+    return _llm_cache_key(kind, f"{prd_hash}\0{feedback}")
+
+
+def _prd_edit_lookup(key: tuple[str, str, str]) -> str | None:
+    text = _prd_edit_cache.get(key)
+    if text is not None:
+        _prd_edit_cache.move_to_end(key)
+        return text
+    disk_key = _prd_edit_disk_key(key)
+    if disk_key:
+        text = llm_cache.get(FORJA_DIR / "cache" / "prd_edit", disk_key)
+        if isinstance(text, str) and text:
+            _prd_edit_cache[key] = text
+            return text
+    return None
+
+
+def _prd_edit_store(key: tuple[str, str, str], text: str) -> None:
+    disk_key = _prd_edit_disk_key(key)
+    if disk_key:
+        llm_cache.put(FORJA_DIR / "cache" / "prd_edit", disk_key, text)
+    _prd_edit_cache[key] = text
+    _prd_edit_cache.move_to_end(key)
+    while len(_prd_edit_cache) > _PRD_EDIT_CACHE_SIZE:
+        _prd_edit_cache.popitem(last=False)
+
+
 def _modify_prd_section(prd_text: str, feedback: str) -> str:
     """Use LLM to modify a specific section of the PRD based on user feedback."""
+    key = _prd_edit_key("modify", prd_text, feedback)
+    cached = _prd_edit_lookup(key)
+    if cached is not None:
+        return cached
     prompt = (
-        f"Here is a PRD:\n\n{prd_text}\n\n"
         f"The user wants this change: \"{feedback}\"\n\n"
         f"Modify ONLY the relevant section. Keep everything else unchanged. "
         f"Return the full updated PRD."
@@ -1293,24 +1883,24 @@ def _modify_prd_section(prd_text: str, feedback: str) -> str:
                 "user's feedback. Do not rewrite sections that don't need changes. "
                 "Return ONLY the PRD in markdown, no preamble."
             ),
+            cache_prefix=f"Here is a PRD:\n\n{prd_text}\n\n",
         )
     except (OSError, TimeoutError, RuntimeError):
         result = ""
     if result:
-        text = result.strip()
-        if text.startswith("```"):
-            first_nl = text.find("\n")
-            last_fence = text.rfind("```")
-            if first_nl != -1 and last_fence > first_nl:
-                text = text[first_nl + 1:last_fence].strip()
+        text = _strip_fence(result)
+        _prd_edit_store(key, text)
         return text
     return prd_text
 
 
 def _regenerate_prd_with_feedback(prd_text: str, feedback: str) -> str:
     """Regenerate the entire PRD incorporating user feedback."""
+    key = _prd_edit_key("regenerate", prd_text, feedback)
+    cached = _prd_edit_lookup(key)
+    if cached is not None:
+        return cached
     prompt = (
-        f"Here is a PRD that needs revision:\n\n{prd_text}\n\n"
         f"The user's feedback: \"{feedback}\"\n\n"
         f"Regenerate the PRD incorporating this feedback. Keep the same "
         f"structure but improve based on the feedback."
@@ -1323,16 +1913,13 @@ def _regenerate_prd_with_feedback(prd_text: str, feedback: str) -> str:
                 "user's feedback while maintaining professional structure. "
                 "Return ONLY the PRD in markdown, no preamble."
             ),
+            cache_prefix=f"Here is a PRD that needs revision:\n\n{prd_text}\n\n",
         )
     except (OSError, TimeoutError, RuntimeError):
         result = ""
     if result:
-        text = result.strip()
-        if text.startswith("```"):
-            first_nl = text.find("\n")
-            last_fence = text.rfind("```")
-            if first_nl != -1 and last_fence > first_nl:
-                text = text[first_nl + 1:last_fence].strip()
+        text = _strip_fence(result)
+        _prd_edit_store(key, text)
         return text
     return prd_text
 
@@ -1358,6 +1945,7 @@ def _interactive_prd_edit(prd_text: str) -> str:
             return prd_text
 
         if choice == "1":
+            _prd_edit_cache.clear()
             return prd_text
         elif choice == "2":
             _flush_stdin()
@@ -1374,8 +1962,7 @@ def _interactive_prd_edit(prd_text: str) -> str:
                 preview = prd_text[:500]
                 if len(prd_text) > 500:
                     preview += "..."
-                for line in preview.splitlines():
-                    print(f"  {line}")
+                _print_indented(preview)
         elif choice == "3":
             _flush_stdin()
             try:
@@ -1393,12 +1980,10 @@ def _interactive_prd_edit(prd_text: str) -> str:
                 preview = prd_text[:500]
                 if len(prd_text) > 500:
                     preview += "..."
-                for line in preview.splitlines():
-                    print(f"  {line}")
+                _print_indented(preview)
         elif choice == "4":
             print()
-            for line in prd_text.splitlines():
-                print(f"  {line}")
+            _print_indented(prd_text)
         elif choice == "5" and previous_version is not None:
             prd_text = previous_version
             previous_version = None
@@ -1417,6 +2002,7 @@ def _save_transcript(round_data, enriched_prd, research_log=None):
         "research": research_log or [],
         "enriched_prd_length": len(enriched_prd) if enriched_prd else 0,
         "enriched_prd": enriched_prd or "",
+        "llm_cache": llm_cache.stats(),
     }
 
     out_path = FORJA_DIR / "plan-transcript.json"
@@ -1426,10 +2012,11 @@ def _save_transcript(round_data, enriched_prd, research_log=None):
         ts = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
         archive_path = FORJA_DIR / f"plan-transcript-{ts}.json"
         out_path.rename(archive_path)
-    out_path.write_text(
-        json.dumps(transcript, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    # Stream straight to the file: the PRD and research findings make the
+    # transcript large, and json.dumps would hold it all in one string.
+    with out_path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        json.dump(transcript, f, indent=2, ensure_ascii=False)
+        f.write("\n")
     return out_path
 
 
@@ -1459,10 +2046,67 @@ def _ask_panel_scope(round_label: str, question_count: int) -> str:
     return "full"
 
 
+def _request_panel(
+    prompt_template: str,
+    prd_content: str,
+    context: str,
+    skill_guidance: str,
+) -> dict | None:
+    """Ask the LLM to assemble an expert panel. Returns the parsed JSON or None.
+
+    With FORJA_LLM_CACHE=1 a successfully parsed panel is cached on disk.
+    """
+    # Most stable first so provider prefix caches can reuse it: the business
+    # context is identical across WHAT and HOW, the template and guidance
+    # per round, while the PRD changes between rounds and edits.
+    prompt = (
+        f"Available context:\n{context}\n\n"
+        f"{prompt_template}\n\n"
+        f"IMPORTANT CONTEXT:\n{skill_guidance}\n\n"
+        f"PRD:\n{prd_content}"
+    )
+    system = "You are a conductor of expertise. Respond only with valid JSON."
+    cache_dir = FORJA_DIR / "cache" / "panel"
+    cache_key = _llm_cache_key(system, prompt)
+    if cache_key:
+        cached = llm_cache.get(cache_dir, cache_key)
+        if isinstance(cached, dict):
+            return cached
+
+    try:
+        raw = _call_claude_code(prompt, system=system)
+    except (OSError, TimeoutError, RuntimeError):
+        raw = ""
+    panel = parse_json(raw) if raw else None
+    if cache_key and isinstance(panel, dict):
+        llm_cache.put(cache_dir, cache_key, panel)
+    return panel
+
+
+def _prefetch(fn, *args) -> Future:
+    """Start ``fn(*args)`` in the background and return its future.
+
+    Runs on a daemon thread so a prefetch the user never needs (e.g. they
+    quit during an edit) cannot hold up interpreter exit.
+    """
+    future: Future = Future()
+
+    def _run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=_run, daemon=True).start()
+    return future
+
+
 def _run_expert_qa(
     prompt_template: str,
-    fallback_experts: list[dict],
-    fallback_questions: list[dict],
+    fallback_experts: tuple[dict, ...] | list[dict],
+    fallback_questions: tuple[dict, ...] | list[dict],
     prd_content: str,
     prd_title: str,
     context: str,
@@ -1472,10 +2116,14 @@ def _run_expert_qa(
     ensure_tech: bool = False,
     ensure_design: bool = False,
     auto_mode: bool = False,
+    *,
+    panel_future: Future | None = None,
 ) -> tuple[list[dict], list[dict], list[dict], list[dict], str]:
     """Run one round of expert panel Q&A.
 
     When *auto_mode* is True, all defaults are accepted without user input.
+    *panel_future* may carry a :func:`_request_panel` result that was
+    prefetched for exactly these arguments; it is used instead of a new call.
 
     Returns ``(experts, questions, qa_transcript, research_log, assessment)``.
     """
@@ -1483,19 +2131,10 @@ def _run_expert_qa(
 
     print(f"\n  {DIM}Assembling {round_label} expert panel...{RESET}")
 
-    try:
-        raw = _call_claude_code(
-            f"{prompt_template}\n\n"
-            f"IMPORTANT CONTEXT:\n{skill_guidance}\n\n"
-            f"PRD:\n{prd_content}\n\n"
-            f"Available context:\n{context}",
-            system="You are a conductor of expertise. Respond only with valid JSON.",
-        )
-    except (OSError, TimeoutError, RuntimeError):
-        raw = ""
-    panel = None
-    if raw:
-        panel = parse_json(raw)
+    if panel_future is not None:
+        panel = panel_future.result()
+    else:
+        panel = _request_panel(prompt_template, prd_content, context, skill_guidance)
 
     # Validate panel structure or use fallback
     if (
@@ -1506,8 +2145,10 @@ def _run_expert_qa(
         or len(panel["questions"]) < 3
     ):
         print(f"  {DIM}Using generic {round_label} panel{RESET}")
-        experts = list(fallback_experts)
-        questions = list(fallback_questions)
+        # Copy so id assignment and expert injection below never touch
+        # the shared fallback constants.
+        experts = [dict(e) for e in fallback_experts]
+        questions = [dict(q) for q in fallback_questions]
         assessment = "PRD needs clarification before building."
     else:
         experts = _deduplicate_experts(panel["experts"])[:3]
@@ -1534,8 +2175,12 @@ def _run_expert_qa(
         print(f"  {DIM}Auto mode: accepting all expert defaults{RESET}")
     print()
 
-    for q in questions:
-        answer, tag = _ask_question(q, experts, prd_summary, research_log, total=total, auto_mode=auto_mode)
+    color_map = _expert_color_map(experts)
+    for idx, q in enumerate(questions):
+        answer, tag = _ask_question(
+            q, experts, prd_summary, research_log,
+            total=total, auto_mode=auto_mode, color_map=color_map,
+        )
 
         if tag == "DONE":
             qa_transcript.append({
@@ -1544,7 +2189,7 @@ def _run_expert_qa(
                 "answer": q["default"],
                 "tag": "SKIPPED",
             })
-            remaining_qs = questions[questions.index(q) + 1:]
+            remaining_qs = questions[idx + 1:]
             for rq in remaining_qs:
                 qa_transcript.append({
                     "expert": rq["expert_name"],
@@ -1564,49 +2209,24 @@ def _run_expert_qa(
         print()
 
     # Summary
-    facts = sum(1 for a in qa_transcript if a["tag"] == "FACT")
-    accepted = sum(1 for a in qa_transcript if a["tag"] == "ACCEPTED")
-    skipped = sum(1 for a in qa_transcript if a["tag"] == "SKIPPED")
+    tag_counts = Counter(a["tag"] for a in qa_transcript)
+    facts, accepted, skipped = tag_counts["FACT"], tag_counts["ACCEPTED"], tag_counts["SKIPPED"]
     print()
-    print(f"  {BOLD}{round_label} Summary:{RESET} {GREEN}{facts} facts{RESET}, "
-          f"{CYAN}{accepted} accepted{RESET}, "
-          f"{YELLOW}{skipped} skipped{RESET}")
+    print(_SUMMARY_FMT.format(
+        round_label=round_label, facts=facts, accepted=accepted, skipped=skipped,
+    ))
 
     return experts, questions, qa_transcript, research_log, assessment
 
 
 def _get_skill_what_guidance(skill: str) -> str:
     """Get skill-specific guidance for WHAT round."""
-    if skill == "landing-page":
-        return (
-            "Focus WHAT questions on: copy and messaging, page sections and flow, "
-            "CTA strategy, audience targeting, visual hierarchy, tone of voice. "
-            "Do NOT ask about databases, APIs, or deployment."
-        )
-    if skill == "api-backend":
-        return (
-            "Focus WHAT questions on: API design and endpoints, data model, "
-            "business rules, user flows, input/output contracts. "
-            "Do NOT ask about visual design, CSS, or frontend layout."
-        )
-    return ""
+    return SKILL_WHAT_GUIDANCE.get(skill, "")
 
 
 def _get_skill_how_guidance(skill: str) -> str:
     """Get skill-specific guidance for HOW round."""
-    if skill == "landing-page":
-        return (
-            "Focus HOW questions on: HTML/CSS framework, build tooling, "
-            "hosting constraints, asset pipeline, responsive strategy. "
-            "Keep it simple — vanilla HTML/CSS/JS is preferred."
-        )
-    if skill == "api-backend":
-        return (
-            "Focus HOW questions on: framework choice (FastAPI/Flask), "
-            "database (SQLite only), auth mechanism, error handling, "
-            "deployment (uvicorn). All deps must be pip-installable."
-        )
-    return ""
+    return SKILL_HOW_GUIDANCE.get(skill, "")
 
 
 # Keyword-based guidance for the "custom" skill
@@ -1649,7 +2269,13 @@ def _check_missing_context() -> None:
 
 # ── Main entry point ────────────────────────────────────────────────
 
-def run_plan(prd_path=None, *, _called_from_runner: bool = False, auto_mode: bool = False) -> bool:
+def run_plan(
+    prd_path=None,
+    *,
+    _called_from_runner: bool = False,
+    auto_mode: bool = False,
+    fast: bool = False,
+) -> bool:
     """Run Forja plan mode with two expert rounds.
 
     Round 1 (WHAT): Product/Strategy experts decide what to build.
@@ -1661,8 +2287,13 @@ def run_plan(prd_path=None, *, _called_from_runner: bool = False, auto_mode: boo
     automatically).
     When *auto_mode* is True, all expert defaults are accepted without
     user input — enables fully autonomous plan generation.
+    When *fast* is True (or ``FORJA_SKIP_ENRICH=1``), the final PRD is
+    assembled directly from the HOW answers instead of being rewritten by
+    the LLM — one fewer large call per run.
     """
     prd_file = Path(prd_path) if prd_path else PRD_PATH
+    _research_cache.clear()
+    llm_cache.reset_stats()
 
     # Detect skill early so scratch flow can constrain PRD generation
     skill = _detect_skill()
@@ -1670,13 +2301,15 @@ def run_plan(prd_path=None, *, _called_from_runner: bool = False, auto_mode: boo
     # Check if PRD is missing or empty/placeholder → scratch flow
     prd_missing = not prd_file.exists()
     prd_empty = False
+    prd_content = ""
     if not prd_missing:
-        content = prd_file.read_text(encoding="utf-8").strip()
-        prd_empty = not content or content in (
+        prd_content = prd_file.read_text(encoding="utf-8").strip()
+        prd_empty = not prd_content or prd_content in (
             "# PRD\n\nDescribe your project here.",
             "# PRD\nDescribe your project here.",
         )
 
+    context_future = None
     if prd_missing or prd_empty:
         load_dotenv()
         existing_context = _read_existing_context()
@@ -1696,6 +2329,10 @@ def run_plan(prd_path=None, *, _called_from_runner: bool = False, auto_mode: boo
             print(f"  {RED}Auto mode requires existing PRD or context. Write a PRD first.{RESET}")
             return False
         else:
+            # Read the context (and warm the design-choice memo) while the
+            # user types.
+            _prefetch(_read_design_choices)
+            context_future = _prefetch(_gather_context)
             prd_content, continue_to_panel = _scratch_flow(
                 existing_context, skill=skill, prd_file=prd_file,
             )
@@ -1704,8 +2341,6 @@ def run_plan(prd_path=None, *, _called_from_runner: bool = False, auto_mode: boo
             if not continue_to_panel:
                 return True
             # prd_content is set, prd_file was written by _scratch_flow()
-    else:
-        prd_content = prd_file.read_text(encoding="utf-8").strip()
 
     # Extract title
     prd_lines = prd_content.split("\n")
@@ -1719,7 +2354,7 @@ def run_plan(prd_path=None, *, _called_from_runner: bool = False, auto_mode: boo
         _check_missing_context()
 
     # Gather context
-    context = _gather_context()
+    context = context_future.result() if context_future is not None else _gather_context()
 
     base_guidance = SKILL_EXPERT_GUIDANCE.get(skill, SKILL_EXPERT_GUIDANCE["custom"])
     if skill == "custom":
@@ -1733,7 +2368,7 @@ def run_plan(prd_path=None, *, _called_from_runner: bool = False, auto_mode: boo
     # ════════════════════════════════════════════════════════════════
     #  ROUND 1 — WHAT (Product / Strategy)
     # ════════════════════════════════════════════════════════════════
-    print(f"\n{BOLD}  ═══ Round 1: WHAT to build ═══{RESET}")
+    print(_ROUND1_HEADER)
 
     what_guidance = base_guidance + "\n" + _get_skill_what_guidance(skill)
 
@@ -1784,39 +2419,55 @@ def run_plan(prd_path=None, *, _called_from_runner: bool = False, auto_mode: boo
     # ── Generate intermediate PRD with WHAT decisions ──
     print(f"\n  {DIM}Incorporating product decisions into PRD...{RESET}")
 
-    what_enriched = _generate_enriched_prd(
-        prd_content, what_transcript, what_experts, skill=skill,
-    )
+    # The Round 1 PRD previews itself as it streams in
+    print()
+    print(f"  {BOLD}── PRD after Round 1 (preview) ──{RESET}")
+    print()
+    preview = _StreamPreview(40)
+    what_enriched = None
+    # Only default answers: the manual fallback says the same without an LLM call
+    if not _only_defaults(what_transcript):
+        what_enriched = _generate_enriched_prd(
+            prd_content, what_transcript, what_experts, skill=skill, on_chunk=preview,
+        )
     if not what_enriched:
         # Manual fallback
         fallback_heading = (
             "## Page Content Decisions" if skill == "landing-page"
             else "## Product Decisions"
         )
-        what_enriched = prd_content + f"\n\n{fallback_heading}\n\n"
-        for a in what_transcript:
-            what_enriched += f"- [{a['tag']}] {a['question']}: {a['answer']}\n"
+        what_enriched = prd_content + f"\n\n{fallback_heading}\n\n" + "".join(
+            _ANSWER_LINE_FMT.format_map(a) for a in what_transcript
+        )
 
-    # ── User can edit between rounds ──
-    print()
-    print(f"  {BOLD}── PRD after Round 1 (preview) ──{RESET}")
-    print()
-    preview_lines = what_enriched.strip().splitlines()
-    for line in preview_lines[:40]:
-        print(f"  {line}")
-    if len(preview_lines) > 40:
-        print(f"  {DIM}... ({len(preview_lines) - 40} more lines){RESET}")
+    preview.finish(what_enriched)
     print()
 
+    # ── User can edit between rounds ──
     if not auto_mode:
         what_enriched = _interactive_prd_edit(what_enriched)
 
     # ════════════════════════════════════════════════════════════════
     #  ROUND 2 — HOW (Technical / Feasibility)
     # ════════════════════════════════════════════════════════════════
-    print(f"\n{BOLD}  ═══ Round 2: HOW to build it ═══{RESET}")
+    print(_ROUND2_HEADER)
+
+    # Design choices from init don't depend on the HOW answers; read them
+    # while the HOW round runs.
+    brand_dir = CONTEXT_DIR / "company" / "brand-assets"
+    has_brand = (brand_dir / "colors.json").exists()
+    design_future = _prefetch(_read_design_choices) if has_brand else None
 
+    # Assemble the HOW panel while the user picks the round scope. A started
+    # request cannot be cancelled, so skipping the round after this still
+    # costs that one call; a user who skipped WHAT likely skips HOW too, so
+    # nothing is prefetched then.
     how_guidance = base_guidance + "\n" + _get_skill_how_guidance(skill)
+    how_panel_future = None
+    if not auto_mode and not what_skip:
+        how_panel_future = _prefetch(
+            _request_panel, HOW_PANEL_PROMPT, what_enriched, context, how_guidance,
+        )
 
     # Let user choose round scope (full / quick / skip)
     how_round_auto = auto_mode
@@ -1852,6 +2503,7 @@ def run_plan(prd_path=None, *, _called_from_runner: bool = False, auto_mode: boo
             ensure_tech=True,
             ensure_design=False,
             auto_mode=how_round_auto,
+            panel_future=how_panel_future,
         )
 
     round_data.append({
@@ -1863,70 +2515,81 @@ def run_plan(prd_path=None, *, _called_from_runner: bool = False, auto_mode: boo
     all_research.extend(how_research)
 
     # ── Design Context (optional — skip if brand-assets from init exist) ──
-    brand_dir = CONTEXT_DIR / "company" / "brand-assets"
-    has_brand = (brand_dir / "colors.json").exists()
-    if has_brand:
+    if design_future is not None:
         print(f"\n  {DIM}Using design choices from init (brand-assets/){RESET}")
-        design_context = _read_design_choices()
+        design_context = design_future.result()
     else:
         design_context = _collect_design_context()
 
     # ── Generate final enriched PRD with both rounds ──
     all_transcript = what_transcript + how_transcript
-    all_experts = what_experts + how_experts
-    # Deduplicate experts by name
-    seen_names: set[str] = set()
-    unique_experts: list[dict] = []
-    for e in all_experts:
-        if e["name"] not in seen_names:
-            seen_names.add(e["name"])
-            unique_experts.append(e)
-
-    print(f"\n  {DIM}Generating final enriched PRD...{RESET}")
-
-    enriched_prd = _generate_enriched_prd(
-        what_enriched, how_transcript, unique_experts, design_context, all_research, skill=skill,
+    # Deduplicate experts by name (first occurrence wins, order kept)
+    experts_by_name: dict[str, dict] = {}
+    for e in what_experts + how_experts:
+        experts_by_name.setdefault(e["name"], e)
+    unique_experts = list(experts_by_name.values())
+
+    skip_enrich = fast or os.environ.get("FORJA_SKIP_ENRICH", "").lower() in ("1", "true", "yes")
+    # Only default answers and nothing the user chose to weave in: the
+    # manual assembly says the same without an LLM call
+    defaults_only = (
+        _only_defaults(how_transcript)
+        and design_context in ("", _DEFAULT_DESIGN_CONTEXT)
+        and not all_research
     )
+    if skip_enrich:
+        print(f"\n  {DIM}Fast mode: assembling final PRD from the answers...{RESET}")
+    elif defaults_only:
+        print(f"\n  {DIM}All defaults: assembling final PRD from the answers...{RESET}")
+        skip_enrich = True
+    else:
+        print(f"\n  {DIM}Generating final enriched PRD...{RESET}")
+
+    # The final PRD previews itself as it streams in
+    print()
+    print(f"  {BOLD}── Final Enriched PRD (preview) ──{RESET}")
+    print()
+    preview = _StreamPreview(60)
+    enriched_prd = None
+    if not skip_enrich:
+        enriched_prd = _generate_enriched_prd(
+            what_enriched, how_transcript, unique_experts, design_context, all_research,
+            skill=skill, on_chunk=preview,
+        )
 
     if not enriched_prd:
-        # Fallback: manual assembly
+        # Manual assembly (fast mode, nothing but defaults, or fallback
+        # when the LLM is unavailable)
         assumptions = sum(1 for a in all_transcript if a["tag"] == "SKIPPED")
-        print(f"  {YELLOW}LLM did not respond. Generating PRD manually.{RESET}")
-        enriched_prd = what_enriched + "\n"
+        if not skip_enrich:
+            print(f"  {YELLOW}LLM did not respond. Generating PRD manually.{RESET}")
         tech_heading = (
             "## Implementation Notes" if skill == "landing-page"
             else "## Technical Decisions"
         )
-        enriched_prd += f"\n{tech_heading}\n\n"
-        for a in how_transcript:
-            enriched_prd += f"- [{a['tag']}] {a['question']}: {a['answer']}\n"
-        enriched_prd += f"\n## Assumption Density: {assumptions}/{len(all_transcript)}\n"
+        prd_parts = [what_enriched, "\n", f"\n{tech_heading}\n\n"]
+        prd_parts.extend(_ANSWER_LINE_FMT.format_map(a) for a in how_transcript)
+        prd_parts.append(f"\n## Assumption Density: {assumptions}/{len(all_transcript)}\n")
         if design_context:
-            enriched_prd += f"\n## Design System\n\n{design_context}\n"
+            prd_parts.append(f"\n## Design System\n\n{design_context}\n")
         if all_research:
-            enriched_prd += "\n## Research Findings\n\n"
+            prd_parts.append("\n## Research Findings\n\n")
             for r in all_research:
-                enriched_prd += f"### {r['topic']}\n{r['findings']}\n\n"
+                prd_parts.append(f"### {r['topic']}\n{r['findings']}\n\n")
+        enriched_prd = "".join(prd_parts)
 
-    # ── Final preview ──
-    print()
-    print(f"  {BOLD}── Final Enriched PRD (preview) ──{RESET}")
-    print()
-    preview_lines = enriched_prd.strip().splitlines()
-    for line in preview_lines[:60]:
-        print(f"  {line}")
-    if len(preview_lines) > 60:
-        print(f"  {DIM}... ({len(preview_lines) - 60} more lines){RESET}")
+    preview.finish(enriched_prd)
     print()
 
     # ── Final interactive edit / confirm ──
     if not auto_mode:
         enriched_prd = _interactive_prd_edit(enriched_prd)
-    prd_file.write_text(enriched_prd + "\n", encoding="utf-8")
+    _write_prd(prd_file, enriched_prd)
     print(f"\n  {GREEN}✔ PRD saved to {prd_file}{RESET}")
 
     # ── Save transcript (both rounds) ──
     transcript_path = _save_transcript(round_data, enriched_prd, all_research)
+    _flush_pending_writes()
     print(f"  {DIM}Transcript: {transcript_path}{RESET}")
 
     if not _called_from_runner:
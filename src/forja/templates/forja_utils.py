@@ -6,9 +6,11 @@ This file is copied to .forja-tools/forja_utils.py during forja init.
 Template scripts import from here instead of duplicating code.
 """
 
+import codecs
 import json
 import os
 import re
+import selectors
 import shutil
 import signal
 import ssl
@@ -136,6 +138,17 @@ def _sanitize_error_body(body):
     return "\n".join(safe_lines)[:100]
 
 
+_ssl_ctx = None
+
+
+def _ssl_context():
+    """Shared TLS context for the raw HTTP clients (CA bundle loaded once)."""
+    global _ssl_ctx
+    if _ssl_ctx is None:
+        _ssl_ctx = ssl.create_default_context()
+    return _ssl_ctx
+
+
 def _call_kimi_raw(prompt, system, model):
     """Call Kimi API. Raises on failure for auto-fallback."""
     load_dotenv()
@@ -167,7 +180,7 @@ def _call_kimi_raw(prompt, system, model):
     )
 
     try:
-        ctx = ssl.create_default_context()
+        ctx = _ssl_context()
         with urllib.request.urlopen(req, timeout=60, context=ctx) as resp:
             body = json.loads(resp.read().decode("utf-8"))
             return body["choices"][0]["message"]["content"]
@@ -184,19 +197,36 @@ def _call_kimi_raw(prompt, system, model):
         raise RuntimeError("Kimi: unexpected response format") from e
 
 
-def _call_anthropic_raw(prompt, system, model, tools=None):
-    """Call Anthropic API. Raises on failure for auto-fallback."""
+def _call_anthropic_raw(prompt, system, model, tools=None, cache_system=False,
+                        cache_prefix=""):
+    """Call Anthropic API. Raises on failure for auto-fallback.
+
+    cache_system sends the system prompt as an ephemeral cache breakpoint;
+    a non-empty cache_prefix is sent the same way ahead of the prompt.
+    Prefixes under 1024 tokens are not cached by Anthropic.
+    """
     load_dotenv()
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
     if not api_key:
         raise RuntimeError("ANTHROPIC_API_KEY not set")
 
+    content = prompt
+    if cache_prefix:
+        content = [
+            {"type": "text", "text": cache_prefix, "cache_control": {"type": "ephemeral"}},
+        ]
+        if prompt:
+            content.append({"type": "text", "text": prompt})
     body_dict = {
         "model": model,
         "max_tokens": 1500,
-        "messages": [{"role": "user", "content": prompt}],
+        "messages": [{"role": "user", "content": content}],
     }
-    if system:
+    if system and cache_system:
+        body_dict["system"] = [
+            {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}},
+        ]
+    elif system:
         body_dict["system"] = system
     if tools:
         body_dict["tools"] = tools
@@ -216,7 +246,7 @@ def _call_anthropic_raw(prompt, system, model, tools=None):
     )
 
     try:
-        ctx = ssl.create_default_context()
+        ctx = _ssl_context()
         with urllib.request.urlopen(req, timeout=90, context=ctx) as resp:
             data = json.loads(resp.read().decode("utf-8"))
             text_parts = [
@@ -271,7 +301,7 @@ def _call_openai_raw(prompt, system, model):
     )
 
     try:
-        ctx = ssl.create_default_context()
+        ctx = _ssl_context()
         with urllib.request.urlopen(req, timeout=60, context=ctx) as resp:
             body = json.loads(resp.read().decode("utf-8"))
             return body["choices"][0]["message"]["content"]
@@ -288,18 +318,42 @@ def _call_openai_raw(prompt, system, model):
         raise RuntimeError("OpenAI: unexpected response format") from e
 
 
-def _call_provider(prompt, system, provider, model, tools=None):
-    """Dispatch to the appropriate provider's raw function."""
+def _call_provider(prompt, system, provider, model, tools=None, on_chunk=None,
+                   cache_system=False, cache_prefix=""):
+    """Dispatch to the appropriate provider's raw function.
+
+    on_chunk, when given, receives the response text once it is complete.
+    cache_prefix is cacheable on Anthropic and prepended to prompt elsewhere.
+    """
     if provider == "kimi":
-        return _call_kimi_raw(prompt, system, model or _get_model("kimi"))
+        text = _call_kimi_raw(cache_prefix + prompt, system, model or _get_model("kimi"))
     elif provider == "anthropic":
-        return _call_anthropic_raw(prompt, system, model or _get_model("anthropic"), tools=tools)
+        text = _call_anthropic_raw(prompt, system, model or _get_model("anthropic"),
+                                   tools=tools, cache_system=cache_system,
+                                   cache_prefix=cache_prefix)
     elif provider == "openai":
-        return _call_openai_raw(prompt, system, model or _get_model("openai"))
-    raise ValueError(f"Unknown provider: {provider}")
+        text = _call_openai_raw(cache_prefix + prompt, system, model or _get_model("openai"))
+    else:
+        raise ValueError(f"Unknown provider: {provider}")
+    if on_chunk is not None and text:
+        on_chunk(text)
+    return text
+
+
+class _StreamOnce:
+    """on_chunk wrapper; after a partially streamed attempt fails, retries stay silent."""
+
+    def __init__(self, on_chunk):
+        self.on_chunk = on_chunk
+        self.spent = False
 
+    def __call__(self, text):
+        self.spent = True
+        self.on_chunk(text)
 
-def call_llm(prompt, system="", provider="auto", model=None, max_retries=2):
+
+def call_llm(prompt, system="", provider="auto", model=None, max_retries=2, on_chunk=None,
+             cache_system=False, cache_prefix=""):
     """Call an LLM provider with retry and exponential backoff.
 
     provider can be 'kimi', 'anthropic', 'openai', or 'auto'.
@@ -311,12 +365,15 @@ def call_llm(prompt, system="", provider="auto", model=None, max_retries=2):
     else:
         providers = [provider]
 
+    stream = _StreamOnce(on_chunk) if on_chunk is not None else None
     last_error = None
     for p in providers:
         p = p.strip()
         for attempt in range(max_retries + 1):
             try:
-                return _call_provider(prompt, system, p, model)
+                return _call_provider(prompt, system, p, model,
+                                      on_chunk=None if stream is None or stream.spent else stream,
+                                      cache_system=cache_system, cache_prefix=cache_prefix)
             except Exception as e:
                 last_error = e
                 if attempt < max_retries:
@@ -342,22 +399,66 @@ def call_anthropic(prompt, system=""):
     return call_llm(prompt, system, provider="anthropic")
 
 
-def _call_claude_code(prompt, system="", timeout=120):
+def _read_streaming(proc, timeout, on_chunk):
+    """Like proc.communicate(timeout=...) but passes stdout text to on_chunk as it arrives."""
+    deadline = time.monotonic() + timeout
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    out = []
+    err = []
+    with selectors.DefaultSelector() as sel:
+        sel.register(proc.stdout, selectors.EVENT_READ, out)
+        sel.register(proc.stderr, selectors.EVENT_READ, err)
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+            for key, _ in sel.select(remaining):
+                data = os.read(key.fd, 4096)
+                if not data:
+                    sel.unregister(key.fileobj)
+                    continue
+                key.data.append(data)
+                if key.data is out:
+                    text = decoder.decode(data)
+                    if text:
+                        on_chunk(text)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        on_chunk(tail)
+    proc.wait(timeout=max(deadline - time.monotonic(), 0.1))
+    return b"".join(out), b"".join(err)
+
+
+def _call_claude_code(prompt, system="", timeout=120, on_chunk=None, cache_system=False,
+                      cache_prefix=""):
     """Call Claude Code CLI and return text response. Fallback to call_llm()."""
+    llm_kwargs = {}
+    if on_chunk is not None:
+        llm_kwargs["on_chunk"] = on_chunk
+    if cache_system:
+        llm_kwargs["cache_system"] = True
+    if cache_prefix:
+        llm_kwargs["cache_prefix"] = cache_prefix
     if shutil.which("claude") is None:
-        return call_llm(prompt, system=system, provider="anthropic")
+        return call_llm(prompt, system=system, provider="anthropic", **llm_kwargs)
 
-    full_prompt = f"{system}\n\n{prompt}" if system else prompt
+    full_prompt = cache_prefix + prompt
+    if system:
+        full_prompt = f"{system}\n\n{full_prompt}"
 
+    stream = None if on_chunk is None else _StreamOnce(on_chunk)
     try:
         proc = subprocess.Popen(
             ["claude", "--dangerously-skip-permissions", "-p", full_prompt,
              "--output-format", "text"],
             stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-            preexec_fn=os.setsid,
+            start_new_session=True,
         )
         try:
-            stdout, stderr = proc.communicate(timeout=timeout)
+            if stream is None:
+                stdout, stderr = proc.communicate(timeout=timeout)
+            else:
+                stdout, stderr = _read_streaming(proc, timeout, stream)
             if proc.returncode == 0 and stdout:
                 return stdout.decode(errors="replace").strip()
         except subprocess.TimeoutExpired:
@@ -372,8 +473,10 @@ def _call_claude_code(prompt, system="", timeout=120):
     except (FileNotFoundError, OSError):
         pass
 
-    # Fallback to direct API
-    return call_llm(prompt, system=system, provider="anthropic")
+    # Fallback to direct API, silent if the CLI already echoed part of an answer
+    if stream is not None and stream.spent:
+        del llm_kwargs["on_chunk"]
+    return call_llm(prompt, system=system, provider="anthropic", **llm_kwargs)
 
 
 def call_provider(provider, messages, timeout=30):
@@ -406,7 +509,7 @@ def call_provider(provider, messages, timeout=30):
     )
 
     try:
-        ctx = ssl.create_default_context()
+        ctx = _ssl_context()
         with urllib.request.urlopen(req, timeout=timeout, context=ctx) as resp:
             return json.loads(resp.read().decode("utf-8"))
     except urllib.error.HTTPError as e:
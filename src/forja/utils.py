@@ -2,20 +2,20 @@
 
 from __future__ import annotations
 
+import codecs
 import json
 import logging
 import os
 import re
+import selectors
 import shutil
 import signal
-import ssl
 import subprocess
 import sys
-import urllib.error
-import urllib.request
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 # ── Structured logging ───────────────────────────────────────────────
 
@@ -174,6 +174,23 @@ def _sanitize_error_body(body: str) -> str:
     return "\n".join(safe_lines)[:100]
 
 
+_ssl_ctx: Optional["ssl.SSLContext"] = None
+
+
+def _ssl_context():
+    """Shared TLS context for the raw HTTP clients.
+
+    Loading the CA bundle costs a few milliseconds per context; every
+    provider call reuses this one instead.  Created on first use so
+    importing forja stays free of ``ssl``.
+    """
+    global _ssl_ctx
+    if _ssl_ctx is None:
+        import ssl
+        _ssl_ctx = ssl.create_default_context()
+    return _ssl_ctx
+
+
 def _call_kimi_raw(
     prompt: str,
     system: str,
@@ -183,6 +200,9 @@ def _call_kimi_raw(
 
     Raises on failure so ``call_llm`` auto-fallback can try the next provider.
     """
+    import urllib.error
+    import urllib.request
+
     load_dotenv()
     api_key = os.environ.get("KIMI_API_KEY", "")
     if not api_key:
@@ -212,7 +232,7 @@ def _call_kimi_raw(
     )
 
     try:
-        ctx = ssl.create_default_context()
+        ctx = _ssl_context()
         with urllib.request.urlopen(req, timeout=60, context=ctx) as resp:
             body = json.loads(resp.read().decode("utf-8"))
             return body["choices"][0]["message"]["content"]
@@ -234,26 +254,57 @@ def _call_anthropic_raw(
     system: str,
     model: str,
     tools: list[dict] | None = None,
+    on_chunk: Callable[[str], None] | None = None,
+    cache_system: bool = False,
+    cache_prefix: str = "",
 ) -> str:
     """Call Anthropic (Claude) messages API.
 
     Raises on failure so ``call_llm`` auto-fallback can try the next provider.
     Accepts optional *tools* for advanced use (e.g. web_search).
+
+    When *on_chunk* is given the request is sent with ``stream=True`` and
+    each text delta is passed to *on_chunk* as it arrives; the full text is
+    still returned once the stream closes.
+
+    With *cache_system* the system prompt is sent as a text block carrying
+    an ephemeral ``cache_control`` breakpoint so repeated calls sharing it
+    are served from Anthropic's prompt cache.  A non-empty *cache_prefix*
+    is sent the same way as the first block of the user message, ahead of
+    *prompt*, so a large stable input (e.g. the PRD) is cached as well.
+    Anthropic ignores breakpoints on prefixes under 1024 tokens, so only
+    mark inputs at least that large; short system prompts gain nothing.
     """
+    import urllib.error
+    import urllib.request
+
     load_dotenv()
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
     if not api_key:
         raise RuntimeError("ANTHROPIC_API_KEY not set")
 
+    content: str | list[dict] = prompt
+    if cache_prefix:
+        content = [
+            {"type": "text", "text": cache_prefix, "cache_control": {"type": "ephemeral"}},
+        ]
+        if prompt:
+            content.append({"type": "text", "text": prompt})
     body: dict = {
         "model": model,
         "max_tokens": 4096,
-        "messages": [{"role": "user", "content": prompt}],
+        "messages": [{"role": "user", "content": content}],
     }
-    if system:
+    if system and cache_system:
+        body["system"] = [
+            {"type": "text", "text": system, "cache_control": {"type": "ephemeral"}},
+        ]
+    elif system:
         body["system"] = system
     if tools:
         body["tools"] = tools
+    if on_chunk is not None:
+        body["stream"] = True
 
     payload = json.dumps(body).encode("utf-8")
 
@@ -270,8 +321,10 @@ def _call_anthropic_raw(
     )
 
     try:
-        ctx = ssl.create_default_context()
+        ctx = _ssl_context()
         with urllib.request.urlopen(req, timeout=90, context=ctx) as resp:
+            if on_chunk is not None:
+                return _read_anthropic_stream(resp, on_chunk)
             data = json.loads(resp.read().decode("utf-8"))
             text_parts = [
                 block["text"]
@@ -294,6 +347,33 @@ def _call_anthropic_raw(
         raise RuntimeError("Claude: unexpected response format") from e
 
 
+def _read_anthropic_stream(resp: Any, on_chunk: Callable[[str], None]) -> str:
+    """Consume an Anthropic server-sent event stream.
+
+    Forwards every ``text_delta`` to *on_chunk* and returns the joined text.
+    Nothing is parsed beyond the individual SSE events, so callers must wait
+    for the returned buffer before decoding any JSON the model produced.
+    """
+    text_parts: list[str] = []
+    for raw_line in resp:
+        line = raw_line.decode("utf-8").strip()
+        if not line.startswith("data:"):
+            continue
+        event = json.loads(line[5:].strip())
+        if event.get("type") == "error":
+            message = event.get("error", {}).get("message", "")
+            raise RuntimeError(f"Claude stream error: {message[:100]}")
+        if event.get("type") != "content_block_delta":
+            continue
+        delta = event.get("delta", {})
+        if delta.get("type") == "text_delta" and delta.get("text"):
+            text_parts.append(delta["text"])
+            on_chunk(delta["text"])
+    if not text_parts:
+        raise RuntimeError("Empty response from Anthropic")
+    return "".join(text_parts)
+
+
 def _call_openai_raw(
     prompt: str,
     system: str,
@@ -303,6 +383,9 @@ def _call_openai_raw(
 
     Raises on failure so ``call_llm`` auto-fallback can try the next provider.
     """
+    import urllib.error
+    import urllib.request
+
     load_dotenv()
     api_key = os.environ.get("OPENAI_API_KEY", "")
     if not api_key:
@@ -332,7 +415,7 @@ def _call_openai_raw(
     )
 
     try:
-        ctx = ssl.create_default_context()
+        ctx = _ssl_context()
         with urllib.request.urlopen(req, timeout=60, context=ctx) as resp:
             body = json.loads(resp.read().decode("utf-8"))
             return body["choices"][0]["message"]["content"]
@@ -354,17 +437,48 @@ def _call_provider(
     system: str,
     provider: str,
     model: str | None,
+    on_chunk: Callable[[str], None] | None = None,
+    cache_system: bool = False,
+    cache_prefix: str = "",
 ) -> str:
-    """Dispatch to the appropriate provider's raw function."""
+    """Dispatch to the appropriate provider's raw function.
+
+    Only Anthropic streams and honours *cache_system* / *cache_prefix*; for
+    the other providers *on_chunk* receives the whole response in one piece
+    and *cache_prefix* is simply prepended to *prompt*.
+    """
     from forja.config_loader import load_config
     cfg = load_config()
     if provider == "kimi":
-        return _call_kimi_raw(prompt, system, model or cfg.models.kimi_model)
+        text = _call_kimi_raw(cache_prefix + prompt, system, model or cfg.models.kimi_model)
     elif provider == "anthropic":
-        return _call_anthropic_raw(prompt, system, model or cfg.models.anthropic_model)
+        return _call_anthropic_raw(
+            prompt, system, model or cfg.models.anthropic_model,
+            on_chunk=on_chunk, cache_system=cache_system, cache_prefix=cache_prefix,
+        )
     elif provider == "openai":
-        return _call_openai_raw(prompt, system, model or cfg.models.openai_model)
-    raise ValueError(f"Unknown provider: {provider}")
+        text = _call_openai_raw(cache_prefix + prompt, system, model or cfg.models.openai_model)
+    else:
+        raise ValueError(f"Unknown provider: {provider}")
+    if on_chunk is not None and text:
+        on_chunk(text)
+    return text
+
+
+class _StreamOnce:
+    """``on_chunk`` wrapper that records whether anything was streamed.
+
+    Once an attempt has echoed text, a retry or fallback must not stream
+    again: its answer would be echoed from the start after the partial one.
+    """
+
+    def __init__(self, on_chunk: Callable[[str], None]) -> None:
+        self.on_chunk = on_chunk
+        self.spent = False
+
+    def __call__(self, text: str) -> None:
+        self.spent = True
+        self.on_chunk(text)
 
 
 def call_llm(
@@ -373,28 +487,38 @@ def call_llm(
     provider: str = "auto",
     model: str | None = None,
     max_retries: int = 2,
+    on_chunk: Callable[[str], None] | None = None,
+    cache_system: bool = False,
+    cache_prefix: str = "",
 ) -> str:
     """Call an LLM provider with retry and exponential backoff.
 
     *provider* can be ``'kimi'``, ``'anthropic'``, ``'openai'``, or ``'auto'``.
     Auto tries kimi first, falls back to anthropic, then openai.
     Each provider is retried up to *max_retries* times with exponential backoff.
+    Pass *on_chunk* to receive response text incrementally as it streams,
+    and *cache_system* to mark the system prompt as cacheable (Anthropic).
+    *cache_prefix* is sent before *prompt* as a cacheable block (Anthropic).
     """
     if provider == "auto":
         providers = ["kimi", "anthropic", "openai"]
     else:
         providers = [provider]
 
+    stream = _StreamOnce(on_chunk) if on_chunk is not None else None
     last_error = None
     for p in providers:
         p = p.strip()
         for attempt in range(max_retries + 1):
             try:
-                return _call_provider(prompt, system, p, model)
+                return _call_provider(
+                    prompt, system, p, model,
+                    on_chunk=None if stream is None or stream.spent else stream,
+                    cache_system=cache_system, cache_prefix=cache_prefix,
+                )
             except Exception as e:
                 last_error = e
                 if attempt < max_retries:
-                    import time
                     delay = min(2 ** attempt, 8)
                     time.sleep(delay)
                     continue
@@ -418,34 +542,97 @@ def call_anthropic(prompt: str, system: str = "") -> str:
     return call_llm(prompt, system, provider="anthropic")
 
 
-def _call_claude_code(prompt: str, system: str = "", timeout: int = 120) -> str:
+def _read_streaming(
+    proc: subprocess.Popen,
+    timeout: float,
+    on_chunk: Callable[[str], None],
+) -> tuple[bytes, bytes]:
+    """Like ``proc.communicate(timeout=...)`` but forwards stdout as it arrives.
+
+    Decoded stdout text is passed to *on_chunk* chunk by chunk; stderr is
+    drained alongside so the child never blocks on a full pipe.
+    Raises :class:`subprocess.TimeoutExpired` once *timeout* elapses.
+    """
+    deadline = time.monotonic() + timeout
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    out: list[bytes] = []
+    err: list[bytes] = []
+    with selectors.DefaultSelector() as sel:
+        sel.register(proc.stdout, selectors.EVENT_READ, out)
+        sel.register(proc.stderr, selectors.EVENT_READ, err)
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+            for key, _ in sel.select(remaining):
+                data = os.read(key.fd, 4096)
+                if not data:
+                    sel.unregister(key.fileobj)
+                    continue
+                key.data.append(data)
+                if key.data is out:
+                    text = decoder.decode(data)
+                    if text:
+                        on_chunk(text)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        on_chunk(tail)
+    proc.wait(timeout=max(deadline - time.monotonic(), 0.1))
+    return b"".join(out), b"".join(err)
+
+
+def _call_claude_code(
+    prompt: str,
+    system: str = "",
+    timeout: int = 120,
+    on_chunk: Callable[[str], None] | None = None,
+    cache_system: bool = False,
+    cache_prefix: str = "",
+) -> str:
     """Call Claude Code CLI (``claude -p``) and return text response.
 
     Falls back to :func:`call_llm` with ``provider="anthropic"`` when the
     ``claude`` binary is not found or the CLI invocation fails.
 
     Args:
-        prompt:  The user prompt to send.
-        system:  Optional system prompt (prepended to *prompt*).
-        timeout: Seconds before the subprocess is terminated.
+        prompt:   The user prompt to send.
+        system:   Optional system prompt (prepended to *prompt*).
+        timeout:  Seconds before the subprocess is terminated.
+        on_chunk: Optional callback receiving response text as it streams.
+        cache_system: Mark *system* as a cacheable prefix on the API fallback.
+        cache_prefix: Stable text sent before *prompt*; cacheable on the
+                  API fallback.
 
     Returns:
         The model's text response.
     """
+    llm_kwargs: dict[str, Any] = {}
+    if on_chunk is not None:
+        llm_kwargs["on_chunk"] = on_chunk
+    if cache_system:
+        llm_kwargs["cache_system"] = True
+    if cache_prefix:
+        llm_kwargs["cache_prefix"] = cache_prefix
     if shutil.which("claude") is None:
-        return call_llm(prompt, system=system, provider="anthropic")
+        return call_llm(prompt, system=system, provider="anthropic", **llm_kwargs)
 
-    full_prompt = f"{system}\n\n{prompt}" if system else prompt
+    full_prompt = cache_prefix + prompt
+    if system:
+        full_prompt = f"{system}\n\n{full_prompt}"
 
+    stream = None if on_chunk is None else _StreamOnce(on_chunk)
     try:
         proc = subprocess.Popen(
             ["claude", "--dangerously-skip-permissions", "-p", full_prompt,
              "--output-format", "text"],
             stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-            preexec_fn=os.setsid,
+            start_new_session=True,
         )
         try:
-            stdout, stderr = proc.communicate(timeout=timeout)
+            if stream is None:
+                stdout, stderr = proc.communicate(timeout=timeout)
+            else:
+                stdout, stderr = _read_streaming(proc, timeout, stream)
             if proc.returncode == 0 and stdout:
                 return stdout.decode(errors="replace").strip()
         except subprocess.TimeoutExpired:
@@ -460,8 +647,10 @@ def _call_claude_code(prompt: str, system: str = "", timeout: int = 120) -> str:
     except (FileNotFoundError, OSError):
         pass
 
-    # Fallback to direct API
-    return call_llm(prompt, system=system, provider="anthropic")
+    # Fallback to direct API, silent if the CLI already echoed part of an answer
+    if stream is not None and stream.spent:
+        del llm_kwargs["on_chunk"]
+    return call_llm(prompt, system=system, provider="anthropic", **llm_kwargs)
 
 
 # ── JSON parsing ────────────────────────────────────────────────────
@@ -536,8 +725,9 @@ def safe_read_json(path: Path, default: Any = None) -> Any:
     that appeared across the codebase.
     """
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError, TypeError):
+        # json.loads takes the raw bytes (UTF-8/16/32), skipping the text layer.
+        return json.loads(path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError, TypeError):
         return default
 
 
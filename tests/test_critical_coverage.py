@@ -135,6 +135,61 @@ class TestCallAnthropicRawPayload:
         assert "Anthropic-version" in captured_req.headers
         assert captured_req.headers["X-api-key"] == "sk-test-key"
 
+    def test_cache_system_sends_cache_control_block(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+        from forja.utils import _call_anthropic_raw
+
+        api_response = json.dumps({
+            "content": [{"type": "text", "text": "ok"}]
+        }).encode("utf-8")
+
+        mock_resp = MagicMock()
+        mock_resp.read.return_value = api_response
+        mock_resp.__enter__ = lambda s: s
+        mock_resp.__exit__ = MagicMock(return_value=False)
+
+        captured_req = None
+
+        def capture_urlopen(req, **kwargs):
+            nonlocal captured_req
+            captured_req = req
+            return mock_resp
+
+        with patch("urllib.request.urlopen", side_effect=capture_urlopen):
+            _call_anthropic_raw(
+                "test", "You are helpful", "claude-sonnet-4-20250514", cache_system=True,
+            )
+
+        payload = json.loads(captured_req.data.decode("utf-8"))
+        assert payload["system"] == [{
+            "type": "text",
+            "text": "You are helpful",
+            "cache_control": {"type": "ephemeral"},
+        }]
+
+    def test_cache_prefix_leads_user_content_as_cached_block(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
+        from forja.utils import _call_anthropic_raw
+
+        mock_resp = MagicMock()
+        mock_resp.read.return_value = json.dumps({
+            "content": [{"type": "text", "text": "ok"}]
+        }).encode("utf-8")
+        mock_resp.__enter__ = lambda s: s
+        mock_resp.__exit__ = MagicMock(return_value=False)
+
+        with patch("urllib.request.urlopen", return_value=mock_resp) as mock_open:
+            _call_anthropic_raw(
+                "Apply the feedback.", "", "claude-sonnet-4-20250514",
+                cache_prefix="PRD:\n# Big PRD\n\n",
+            )
+
+        payload = json.loads(mock_open.call_args[0][0].data.decode("utf-8"))
+        assert payload["messages"] == [{"role": "user", "content": [
+            {"type": "text", "text": "PRD:\n# Big PRD\n\n", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "Apply the feedback."},
+        ]}]
+
     def test_omits_system_when_empty(self, monkeypatch):
         monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test-key")
         from forja.utils import _call_anthropic_raw
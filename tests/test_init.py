@@ -153,6 +153,21 @@ class TestInitDirectoryValidation:
         from forja.init import run_init
         assert run_init(directory="/tmp", force=True) is False
 
+    def test_import_does_not_need_home(self):
+        import importlib
+        import forja.init
+        try:
+            with patch("pathlib.Path.home", side_effect=RuntimeError("no home")):
+                importlib.reload(forja.init)
+        finally:
+            importlib.reload(forja.init)
+
+    def test_rejects_symlinked_system_dir(self, tmp_path):
+        from forja.init import run_init
+        link = tmp_path / "etc-link"
+        link.symlink_to("/etc")
+        assert run_init(directory=str(link), force=True) is False
+
 
 class TestCopySkill:
     """Tests for _copy_skill copying agents.json and workflow.json."""
@@ -205,3 +220,14 @@ class TestCopySkill:
 
         assert not (tools_dir / "skill.json").exists()
         assert not (tools_dir / "workflow.json").exists()
+
+    def test_skill_json_is_byte_identical_to_template(self, tmp_path):
+        from importlib import resources
+        from forja.init import _copy_skill, FORJA_TOOLS
+        tools_dir = tmp_path / FORJA_TOOLS
+        tools_dir.mkdir(parents=True)
+
+        _copy_skill(tmp_path, "landing-page")
+
+        template = resources.files("forja") / "templates" / "skills" / "landing-page" / "agents.json"
+        assert (tools_dir / "skill.json").read_bytes() == template.read_bytes()
@@ -0,0 +1,86 @@
+"""Tests for forja.llm_cache — opt-in content-addressed LLM response cache."""
+
+from __future__ import annotations
+
+import os
+
+from forja import llm_cache
+
+
+class TestEnabled:
+    def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("FORJA_LLM_CACHE", raising=False)
+        assert llm_cache.enabled() is False
+
+    def test_truthy_values(self, monkeypatch):
+        for value in ("1", "true", "YES"):
+            monkeypatch.setenv("FORJA_LLM_CACHE", value)
+            assert llm_cache.enabled() is True
+
+    def test_custom_env_var(self, monkeypatch):
+        monkeypatch.setenv("FORJA_OTHER_CACHE", "1")
+        assert llm_cache.enabled("FORJA_OTHER_CACHE") is True
+
+    def test_no_cache_overrides_opt_in(self, monkeypatch):
+        monkeypatch.setenv("FORJA_LLM_CACHE", "1")
+        monkeypatch.setenv("FORJA_NO_CACHE", "1")
+        assert llm_cache.enabled() is False
+        assert llm_cache.enabled("FORJA_LLM_CACHE") is False
+
+
+class TestCacheKey:
+    def test_stable_and_sensitive_to_every_part(self):
+        key = llm_cache.cache_key("sys", "prompt", "model")
+        assert key == llm_cache.cache_key("sys", "prompt", "model")
+        assert len(key) == 64
+        assert key != llm_cache.cache_key("sys", "prompt", "other-model")
+        assert key != llm_cache.cache_key("sysprompt", "", "model")
+
+
+class TestGetPut:
+    def test_round_trip(self, tmp_path):
+        llm_cache.put(tmp_path / "panel", "abc", {"experts": ["x"]})
+        assert llm_cache.get(tmp_path / "panel", "abc") == {"experts": ["x"]}
+
+    def test_miss_returns_none(self, tmp_path):
+        assert llm_cache.get(tmp_path, "missing") is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        llm_cache.put(tmp_path, "abc", "value")
+        entry = tmp_path / "abc.json"
+        old = entry.stat().st_mtime - 100
+        os.utime(entry, (old, old))
+        assert llm_cache.get(tmp_path, "abc", ttl=50) is None
+        assert llm_cache.get(tmp_path, "abc", ttl=500) == "value"
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        (tmp_path / "abc.json").write_text("{not json", encoding="utf-8")
+        assert llm_cache.get(tmp_path, "abc") is None
+
+    def test_unwritable_directory_is_ignored(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        llm_cache.put(blocker / "sub", "abc", "value")  # must not raise
+        assert llm_cache.get(blocker / "sub", "abc") is None
+
+    def test_put_replaces_atomically_without_leftovers(self, tmp_path):
+        llm_cache.put(tmp_path, "abc", "old")
+        llm_cache.put(tmp_path, "abc", "new")
+        assert llm_cache.get(tmp_path, "abc") == "new"
+        assert [p.name for p in tmp_path.iterdir()] == ["abc.json"]
+
+    def test_unserialisable_value_leaves_no_temp_file(self, tmp_path):
+        llm_cache.put(tmp_path, "abc", object())  # must not raise
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestStats:
+    def test_counts_hits_and_misses_per_lookup(self, tmp_path):
+        llm_cache.reset_stats()
+        llm_cache.put(tmp_path, "abc", "value")
+        llm_cache.get(tmp_path, "abc")
+        llm_cache.get(tmp_path, "missing")
+        llm_cache.get(tmp_path, "abc")
+        assert llm_cache.stats() == {"hits": 2, "misses": 1}
+        llm_cache.reset_stats()
+        assert llm_cache.stats() == {"hits": 0, "misses": 0}
@@ -7,6 +7,7 @@ Covers:
 4. Backward-compat wrappers - call_kimi/call_anthropic delegate to call_llm
 5. OpenAI raw provider - _call_openai_raw sends correct payload
 6. _call_claude_code - Claude Code CLI helper with fallback
+7. Streaming - on_chunk receives text as it arrives
 """
 
 import json
@@ -186,6 +187,31 @@ class TestOpenAIRaw:
         ]
         assert "Bearer sk-openai-test" in captured_req.headers.get("Authorization", "")
 
+    def test_reuses_one_tls_context_across_calls(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-openai-test")
+
+        from forja.utils import _call_openai_raw
+
+        api_response = json.dumps({
+            "choices": [{"message": {"content": "ok"}}]
+        }).encode("utf-8")
+        contexts = []
+
+        def capture_urlopen(req, **kwargs):
+            contexts.append(kwargs.get("context"))
+            mock_resp = MagicMock()
+            mock_resp.read.return_value = api_response
+            mock_resp.__enter__ = lambda s: s
+            mock_resp.__exit__ = MagicMock(return_value=False)
+            return mock_resp
+
+        with patch("urllib.request.urlopen", side_effect=capture_urlopen):
+            _call_openai_raw("one", "", "gpt-4o")
+            _call_openai_raw("two", "", "gpt-4o")
+
+        assert contexts[0] is not None
+        assert contexts[0] is contexts[1]
+
     def test_raises_without_key(self, monkeypatch):
         monkeypatch.delenv("OPENAI_API_KEY", raising=False)
 
@@ -219,6 +245,10 @@ class TestCallClaudeCode:
         assert "-p" in args
         assert "--output-format" in args
         assert "text" in args
+        # Thread-safe replacement for preexec_fn=os.setsid (callers use pools)
+        kwargs = mock_popen.call_args[1]
+        assert kwargs["start_new_session"] is True
+        assert "preexec_fn" not in kwargs
 
     def test_combines_system_and_user_prompt(self, monkeypatch):
         from forja.utils import _call_claude_code
@@ -284,3 +314,148 @@ class TestCallClaudeCode:
 
         assert result == "fallback"
         mock_llm.assert_called_once()
+
+
+class TestStreaming:
+    """on_chunk streams text from the Anthropic SSE API and the CLI."""
+
+    def test_anthropic_stream_forwards_text_deltas(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-test")
+
+        from forja.utils import _call_anthropic_raw
+
+        events = [
+            {"type": "message_start", "message": {}},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": '{"ti'}},
+            {"type": "content_block_delta", "delta": {"type": "text_delta", "text": 'tle": 1}'}},
+            {"type": "message_stop"},
+        ]
+        lines = []
+        for ev in events:
+            lines.append(f"event: {ev['type']}\n".encode("utf-8"))
+            lines.append(f"data: {json.dumps(ev)}\n".encode("utf-8"))
+            lines.append(b"\n")
+
+        captured_req = None
+
+        def capture_urlopen(req, **kwargs):
+            nonlocal captured_req
+            captured_req = req
+            mock_resp = MagicMock()
+            mock_resp.__iter__ = lambda s: iter(lines)
+            mock_resp.__enter__ = lambda s: s
+            mock_resp.__exit__ = MagicMock(return_value=False)
+            return mock_resp
+
+        chunks = []
+        with patch("urllib.request.urlopen", side_effect=capture_urlopen):
+            result = _call_anthropic_raw("hi", "", "claude-test", on_chunk=chunks.append)
+
+        assert chunks == ['{"ti', 'tle": 1}']
+        assert result == '{"title": 1}'
+        assert json.loads(captured_req.data.decode("utf-8"))["stream"] is True
+
+    def test_non_streaming_provider_emits_single_chunk(self, monkeypatch):
+        from forja.utils import _call_provider
+
+        chunks = []
+        with patch("forja.utils._call_kimi_raw", return_value="whole text"):
+            result = _call_provider("hi", "", "kimi", "kimi-test", on_chunk=chunks.append)
+
+        assert result == "whole text"
+        assert chunks == ["whole text"]
+
+    def test_read_streaming_forwards_stdout_incrementally(self):
+        import sys
+
+        from forja.utils import _read_streaming
+
+        proc = subprocess.Popen(
+            [sys.executable, "-c",
+             "import sys; sys.stdout.write('héllo '); sys.stdout.flush(); "
+             "sys.stderr.write('warn'); print('world')"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+        chunks = []
+        stdout, stderr = _read_streaming(proc, 30, chunks.append)
+
+        assert "".join(chunks) == "héllo world\n"
+        assert stdout.decode("utf-8") == "héllo world\n"
+        assert stderr == b"warn"
+        assert proc.returncode == 0
+
+    def test_read_streaming_times_out(self):
+        import sys
+
+        from forja.utils import _read_streaming
+
+        proc = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(5)"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        )
+        try:
+            with pytest.raises(subprocess.TimeoutExpired):
+                _read_streaming(proc, 0.2, lambda _: None)
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_retry_after_partial_stream_is_not_streamed_again(self, monkeypatch):
+        from forja.utils import call_llm
+        monkeypatch.setattr("forja.utils.time.sleep", lambda _: None)
+        seen = []
+
+        def flaky(prompt, system, provider, model, on_chunk=None, **kwargs):
+            seen.append(on_chunk)
+            if len(seen) == 1:
+                on_chunk("# Half a dr")
+                raise OSError("connection reset")
+            return "# Full draft"
+
+        chunks = []
+        with patch("forja.utils._call_provider", side_effect=flaky):
+            result = call_llm("hi", provider="anthropic", on_chunk=chunks.append)
+
+        assert result == "# Full draft"
+        assert chunks == ["# Half a dr"]
+        assert seen[1] is None
+
+    def test_retry_after_silent_failure_still_streams(self, monkeypatch):
+        from forja.utils import call_llm
+        monkeypatch.setattr("forja.utils.time.sleep", lambda _: None)
+
+        attempts = []
+
+        def flaky(prompt, system, provider, model, on_chunk=None, **kwargs):
+            attempts.append(on_chunk)
+            if len(attempts) == 1:
+                raise OSError("refused")  # fails before any text arrives
+            on_chunk("# Draft")
+            return "# Draft"
+
+        chunks = []
+        with patch("forja.utils._call_provider", side_effect=flaky):
+            assert call_llm("hi", provider="anthropic", on_chunk=chunks.append) == "# Draft"
+        assert chunks == ["# Draft"]
+
+    def test_cli_partial_stream_makes_api_fallback_silent(self, monkeypatch):
+        import sys
+
+        from forja.utils import _call_claude_code
+
+        monkeypatch.setattr("forja.utils.shutil.which", lambda _: "/usr/local/bin/claude")
+        real_popen = subprocess.Popen
+
+        def failing_cli(args, **kwargs):
+            return real_popen(
+                [sys.executable, "-c", "print('# Half'); raise SystemExit(1)"], **kwargs,
+            )
+
+        chunks = []
+        with patch("forja.utils.subprocess.Popen", side_effect=failing_cli), \
+             patch("forja.utils.call_llm", return_value="# Full draft") as mock_llm:
+            result = _call_claude_code("hi", on_chunk=chunks.append)
+
+        assert result == "# Full draft"
+        assert "".join(chunks) == "# Half\n"
+        assert "on_chunk" not in mock_llm.call_args[1]
@@ -1,7 +1,7 @@
-"""Tests for forja.utils.parse_json."""
+"""Tests for forja.utils.parse_json and safe_read_json."""
 
 import pytest
-from forja.utils import parse_json
+from forja.utils import parse_json, safe_read_json
 
 
 class TestDirectParse:
@@ -105,3 +105,20 @@ class TestEdgeCases:
         result = parse_json(text)
         assert result is not None
         assert result["code"] == "if (x) { return y; }"
+
+
+class TestSafeReadJson:
+    """File-backed parse that never raises."""
+
+    def test_reads_utf8_file(self, tmp_path):
+        path = tmp_path / "a.json"
+        path.write_text('{"text": "héllo"}', encoding="utf-8")
+        assert safe_read_json(path) == {"text": "héllo"}
+
+    def test_missing_file_returns_default(self, tmp_path):
+        assert safe_read_json(tmp_path / "missing.json", default={}) == {}
+
+    def test_invalid_utf8_returns_default(self, tmp_path):
+        path = tmp_path / "bad.json"
+        path.write_bytes(b'{"text": "\xff"}')
+        assert safe_read_json(path) is None
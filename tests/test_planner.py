@@ -86,6 +86,18 @@ class TestTechnicalExpert:
         assert new_experts[0]["name"] == "Software Architect"
         assert len(new_questions) == 0
 
+    def test_matches_whole_tokens_only(self):
+        """Keywords count as whole words, case-insensitively — not substrings."""
+        from forja.planner import _ensure_technical_expert, TECHNICAL_EXPERT
+        substring_only = [
+            {"name": "Rebuilder", "field": "Ecosystems"},
+            {"name": "Stackholder", "field": "Product"},
+        ]
+        new_experts, _ = _ensure_technical_expert(substring_only, [])
+        assert TECHNICAL_EXPERT in new_experts
+        new_experts, _ = _ensure_technical_expert([{"name": "PM", "field": "DEVOPS lead"}], [])
+        assert TECHNICAL_EXPERT not in new_experts
+
     def test_handles_fewer_than_3_experts(self):
         """Panel with <3 experts appends instead of replacing."""
         from forja.planner import _ensure_technical_expert, TECHNICAL_EXPERT
@@ -111,6 +123,14 @@ class TestTechnicalExpert:
         assert tech_qs[1]["id"] == 7
         assert tech_qs[2]["id"] == 8
 
+    def test_technical_question_ids_follow_highest_unsorted_id(self):
+        """LLM question IDs may be unsorted; new IDs continue after the max."""
+        from forja.planner import _ensure_technical_expert
+        experts = [{"name": "A", "field": "Marketing"}]
+        questions = [{"id": 7}, {"id": 2}, {}]
+        _, new_qs = _ensure_technical_expert(experts, questions)
+        assert new_qs[3]["id"] == 8
+
     def test_fallback_experts_already_have_tech(self):
         """FALLBACK_EXPERTS has Software Architect — no injection needed."""
         from forja.planner import _ensure_technical_expert, FALLBACK_EXPERTS, FALLBACK_QUESTIONS
@@ -243,6 +263,67 @@ class TestModifyPrdSection:
         assert result == "# Original PRD"
 
 
+class TestStripFence:
+    def test_strips_fence_with_language_tag(self):
+        from forja.planner import _strip_fence
+        assert _strip_fence("  ```markdown\n# PRD\n```\n") == "# PRD"
+
+    def test_unfenced_text_is_only_trimmed(self):
+        from forja.planner import _strip_fence
+        assert _strip_fence("\n# PRD\nBody\n") == "# PRD\nBody"
+
+    def test_cuts_at_last_closing_fence(self):
+        from forja.planner import _strip_fence
+        text = "```md\n# PRD\n```bash\nls\n```\n```"
+        assert _strip_fence(text) == "# PRD\n```bash\nls\n```"
+
+    def test_opening_fence_without_newline_is_kept(self):
+        from forja.planner import _strip_fence
+        assert _strip_fence("```just one line") == "```just one line"
+
+
+class TestPrdEditCache:
+    """Verify repeated PRD edits reuse the previous LLM result."""
+
+    def test_same_feedback_reuses_result(self):
+        from forja.planner import _modify_prd_section, _regenerate_prd_with_feedback
+        with patch("forja.planner._call_claude_code",
+                   return_value="# Edited") as mock_llm:
+            first = _modify_prd_section("# Cached PRD", "tighten scope")
+            second = _modify_prd_section("# Cached PRD", "tighten scope")
+            _modify_prd_section("# Cached PRD", "other change")
+            _regenerate_prd_with_feedback("# Cached PRD", "tighten scope")
+        assert first == second == "# Edited"
+        assert mock_llm.call_count == 3
+
+    def test_failures_are_not_cached(self):
+        from forja.planner import _modify_prd_section
+        with patch("forja.planner._call_claude_code", side_effect=[None, "# Fixed"]):
+            assert _modify_prd_section("# Flaky PRD", "fix") == "# Flaky PRD"
+            assert _modify_prd_section("# Flaky PRD", "fix") == "# Fixed"
+
+    def test_accepting_prd_clears_cache(self):
+        from forja import planner
+        with patch("forja.planner._call_claude_code", return_value="# Edited"):
+            planner._modify_prd_section("# Accepted PRD", "tweak")
+        assert planner._prd_edit_cache
+        with patch("builtins.input", return_value="1"), \
+             patch("forja.planner._flush_stdin"):
+            planner._interactive_prd_edit("# Accepted PRD")
+        assert not planner._prd_edit_cache
+
+
+    def test_persists_across_sessions_with_llm_cache(self, tmp_path, monkeypatch):
+        from forja import planner
+        monkeypatch.setenv("FORJA_LLM_CACHE", "1")
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        with patch("forja.planner._call_claude_code", return_value="# Edited") as mock_llm:
+            planner._modify_prd_section("# Disk PRD", "tweak")
+            planner._prd_edit_cache.clear()  # accepted; next session starts empty
+            assert planner._modify_prd_section("# Disk PRD", "tweak") == "# Edited"
+        assert mock_llm.call_count == 1
+        assert list((tmp_path / ".forja" / "cache" / "prd_edit").iterdir())
+
 class TestRegeneratePrdWithFeedback:
     """Verify _regenerate_prd_with_feedback delegates to LLM correctly."""
 
@@ -272,7 +353,7 @@ class TestDoResearch:
 
     def test_returns_findings_from_claude(self, tmp_path, monkeypatch):
         """Claude web search returns findings → returned and saved."""
-        from forja.planner import _do_research
+        from forja.planner import _do_research, _flush_pending_writes
         monkeypatch.chdir(tmp_path)
         # Create .forja dir so save works
         (tmp_path / ".forja").mkdir()
@@ -282,6 +363,7 @@ class TestDoResearch:
                    return_value="FastAPI is great for async APIs."):
             result = _do_research("Architect", "FastAPI best practices", "project ctx")
         assert result == "FastAPI is great for async APIs."
+        _flush_pending_writes()
         # Check file was saved
         research_dir = tmp_path / ".forja" / "research"
         assert research_dir.exists()
@@ -316,13 +398,173 @@ class TestDoResearch:
         assert not research_dir.exists() or len(list(research_dir.glob("*.md"))) == 0
 
 
+    def test_research_many_runs_concurrently_in_order(self, tmp_path, monkeypatch):
+        """Multiple topics are researched in parallel and returned in input order."""
+        import threading
+        from forja.planner import _do_research_many
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_research(expert_name, expert_field, topic, prd_summary):
+            barrier.wait()  # only passes if all three calls are in flight together
+            return f"findings for {topic}"
+
+        with patch("forja.planner._call_claude_research", side_effect=fake_research):
+            results = _do_research_many("Architect", ["a", "b", "c"], "ctx")
+        assert results == ["findings for a", "findings for b", "findings for c"]
+
+    def test_fallback_batches_topics_into_one_call(self, tmp_path, monkeypatch):
+        """Topics without web results share one tagged expert-knowledge call."""
+        from forja.planner import _do_research_many
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        reply = "[1] Use Redis.\nTTL of 60s.\n[2] Use SQS."
+        with patch("forja.planner._call_claude_research", return_value=None), \
+             patch("forja.planner._call_claude_code", return_value=reply) as mock_llm:
+            results = _do_research_many("Architect", ["caching", "queues"], "ctx")
+        assert results == ["Use Redis.\nTTL of 60s.", "Use SQS."]
+        assert mock_llm.call_count == 1
+        assert "[1] caching\n[2] queues" in mock_llm.call_args[0][0]
+
+    def test_fallback_retries_topics_missing_from_batch(self, tmp_path, monkeypatch):
+        from forja.planner import _do_research_many
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        with patch("forja.planner._call_claude_research", return_value=None), \
+             patch("forja.planner._call_claude_code",
+                   side_effect=["[1] Use Redis.", "Use SQS."]) as mock_llm:
+            results = _do_research_many("Architect", ["caching", "queues"], "ctx")
+        assert results == ["Use Redis.", "Use SQS."]
+        assert "Research topic: queues" in mock_llm.call_args[0][0]
+
+    def test_fallback_retries_run_concurrently(self, tmp_path, monkeypatch):
+        import threading
+        from forja.planner import _do_research_many
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_llm(prompt, system=""):
+            if "Research topics:" in prompt:
+                return "no tags here"
+            barrier.wait()  # both retries must be in flight together
+            return "answer for " + prompt.split("Research topic: ")[1].split("\n")[0]
+
+        with patch("forja.planner._call_claude_research", return_value=None), \
+             patch("forja.planner._call_claude_code", side_effect=fake_llm):
+            results = _do_research_many("Architect", ["caching", "queues"], "ctx")
+        assert results == ["answer for caching", "answer for queues"]
+
+    def test_ask_question_researches_separated_topics(self, tmp_path, monkeypatch):
+        from forja.planner import _ask_question
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        q = {"expert_name": "Architect", "id": 1, "question": "Q?", "why": "W", "default": "D"}
+        log: list = []
+        with patch("builtins.input", side_effect=["research caching;; queues", ""]), \
+             patch("forja.planner._call_claude_research", side_effect=lambda *a: f"on {a[2]}"):
+            _ask_question(q, [{"name": "Architect", "field": "Design"}], "ctx", research_log=log)
+        assert [r["topic"] for r in log] == ["caching", "queues"]
+        assert log[1]["findings"] == "on queues"
+
+    def test_ask_question_keeps_single_semicolon_topic_whole(self, tmp_path, monkeypatch):
+        from forja.planner import _ask_question
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        q = {"expert_name": "Architect", "id": 1, "question": "Q?", "why": "W", "default": "D"}
+        log: list = []
+        with patch("builtins.input", side_effect=["research CSP; nonce vs hash", ""]), \
+             patch("forja.planner._call_claude_research",
+                   side_effect=lambda *a: f"on {a[2]}") as mock_research:
+            _ask_question(q, [{"name": "Architect", "field": "Design"}], "ctx", research_log=log)
+        assert mock_research.call_count == 1
+        assert log == [{"topic": "CSP; nonce vs hash", "findings": "on CSP; nonce vs hash"}]
+
+
+    def test_web_research_memoized_per_topic_and_prd(self, monkeypatch):
+        from forja.planner import _call_claude_research
+        monkeypatch.delenv("FORJA_LLM_CACHE", raising=False)
+        monkeypatch.setattr("forja.planner._research_cache", {})
+        with patch("forja.planner._call_claude_code", return_value="Use Redis.") as mock_llm:
+            first = _call_claude_research("A", "Backend", "Caching  strategy", "ctx")
+            again = _call_claude_research("B", "Backend", "caching strategy", "ctx")
+            _call_claude_research("A", "Backend", "caching strategy", "other ctx")
+        assert first == again == "Use Redis."
+        assert mock_llm.call_count == 2
+
+    def test_failed_web_research_is_not_memoized(self, monkeypatch):
+        from forja.planner import _call_claude_research
+        monkeypatch.delenv("FORJA_LLM_CACHE", raising=False)
+        monkeypatch.setattr("forja.planner._research_cache", {})
+        with patch("forja.planner._call_claude_code", side_effect=[None, "Found it."]) as mock_llm:
+            assert _call_claude_research("A", "Backend", "caching", "ctx") is None
+            assert _call_claude_research("A", "Backend", "caching", "ctx") == "Found it."
+        assert mock_llm.call_count == 2
+
+    def test_web_research_persists_with_llm_cache(self, tmp_path, monkeypatch):
+        from forja import planner
+        monkeypatch.setenv("FORJA_LLM_CACHE", "1")
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        monkeypatch.setattr("forja.planner._research_cache", {})
+        with patch("forja.planner._call_claude_code", return_value="Use Redis.") as mock_llm:
+            planner._call_claude_research("A", "Backend", "caching", "ctx")
+            planner._research_cache.clear()  # new session
+            assert planner._call_claude_research("A", "Backend", "caching", "ctx") == "Use Redis."
+        assert mock_llm.call_count == 1
+
+    def test_topic_differing_in_case_and_punctuation_reuses_findings(self, monkeypatch):
+        from forja.planner import _call_claude_research
+        monkeypatch.delenv("FORJA_LLM_CACHE", raising=False)
+        monkeypatch.setattr("forja.planner._research_cache", {})
+        with patch("forja.planner._call_claude_code", return_value="Use Redis.") as mock_llm:
+            _call_claude_research("A", "Backend", "caching strategy for the public API", "ctx")
+            again = _call_claude_research("A", "Backend", "Caching strategy for the public API?", "ctx")
+            _call_claude_research("A", "Frontend", "caching strategy for the public API", "ctx")
+        assert again == "Use Redis."
+        assert mock_llm.call_count == 2
+
+    def test_similar_but_different_topic_is_researched_again(self, monkeypatch):
+        from forja.planner import _call_claude_research
+        monkeypatch.delenv("FORJA_LLM_CACHE", raising=False)
+        monkeypatch.setattr("forja.planner._research_cache", {})
+        with patch("forja.planner._call_claude_code",
+                   side_effect=["Use Flask-Login.", "Use django.contrib.sessions."]) as mock_llm:
+            _call_claude_research("A", "Backend", "session handling in a flask web application", "ctx")
+            django = _call_claude_research(
+                "A", "Backend", "session handling in a django web application", "ctx",
+            )
+        assert django == "Use django.contrib.sessions."
+        assert mock_llm.call_count == 2
+
+    def test_disk_lookup_counts_once(self, tmp_path, monkeypatch):
+        from forja import llm_cache, planner
+        monkeypatch.setenv("FORJA_LLM_CACHE", "1")
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        monkeypatch.setattr("forja.planner._research_cache", {})
+        llm_cache.reset_stats()
+        with patch("forja.planner._call_claude_code", return_value="Use Redis."):
+            planner._call_claude_research("A", "Backend", "caching", "ctx")
+            planner._research_cache.clear()
+            planner._call_claude_research("A", "Backend", "Caching.", "ctx")
+        assert llm_cache.stats() == {"hits": 1, "misses": 1}
+
+    def test_repeated_topic_reuses_research_memo(self, tmp_path, monkeypatch):
+        from forja.planner import _ask_question
+        monkeypatch.delenv("FORJA_LLM_CACHE", raising=False)
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        monkeypatch.setattr("forja.planner._research_cache", {})
+        q = {"expert_name": "Architect", "id": 1, "question": "Q?", "why": "W", "default": "D"}
+        log: list = []
+        with patch("builtins.input", side_effect=["research caching", "research Caching ", ""]), \
+             patch("forja.planner._call_claude_code", return_value="Use Redis.") as mock_llm:
+            _ask_question(q, [{"name": "Architect", "field": "Design"}], "ctx", research_log=log)
+        assert mock_llm.call_count == 1
+        assert log == [{"topic": "caching", "findings": "Use Redis."}]
+
+
 class TestSaveResearch:
     """Verify _save_research persists findings correctly."""
 
     def test_creates_file_with_slug(self, tmp_path, monkeypatch):
-        from forja.planner import _save_research
+        from forja.planner import _flush_pending_writes, _save_research
         monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
         _save_research("FastAPI vs Flask", "FastAPI wins for async.")
+        _flush_pending_writes()
         fpath = tmp_path / ".forja" / "research" / "fastapi-vs-flask.md"
         assert fpath.exists()
         content = fpath.read_text()
@@ -330,6 +572,27 @@ class TestSaveResearch:
         assert "FastAPI wins for async." in content
 
 
+    def test_slug_keeps_unicode_letters_and_replaces_underscores(self, tmp_path, monkeypatch):
+        from forja.planner import _flush_pending_writes, _save_research
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        _save_research("Café_API: ¿qué?", "notes")
+        _flush_pending_writes()
+        assert (tmp_path / ".forja" / "research" / "café-api---qué-.md").exists()
+
+    def test_write_is_pinned_to_cwd_at_call_time(self, tmp_path, monkeypatch):
+        import threading
+        from forja import planner
+        gate = threading.Event()
+        planner._IO_POOL.submit(gate.wait, 5)
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr("forja.planner.FORJA_DIR", Path(".forja"))
+        planner._save_research("queued", "findings")
+        monkeypatch.chdir(tmp_path.parent)
+        gate.set()
+        planner._flush_pending_writes()
+        assert (tmp_path / ".forja" / "research" / "queued.md").exists()
+
+
 class TestResearchInEnrichedPrd:
     """Verify research findings are included in enriched PRD generation."""
 
@@ -496,6 +759,95 @@ class TestDetectSkill:
         assert _detect_skill() == "custom"
 
 
+class TestDetectSkillCache:
+    """Verify memoized skill and design reads still see file changes."""
+
+    def test_detect_skill_reads_file_once(self, tmp_path, monkeypatch):
+        from forja import planner
+        monkeypatch.chdir(tmp_path)
+        tools_dir = tmp_path / ".forja-tools"
+        tools_dir.mkdir()
+        (tools_dir / "skill.json").write_text(json.dumps({"skill": "api-backend"}))
+        with patch("forja.planner.json.loads", wraps=json.loads) as mock_loads:
+            assert planner._detect_skill() == "api-backend"
+            assert planner._detect_skill() == "api-backend"
+        assert mock_loads.call_count == 1
+
+    def test_detect_skill_sees_rewritten_file(self, tmp_path, monkeypatch):
+        from forja.planner import _detect_skill
+        monkeypatch.chdir(tmp_path)
+        tools_dir = tmp_path / ".forja-tools"
+        tools_dir.mkdir()
+        skill_file = tools_dir / "skill.json"
+        skill_file.write_text(json.dumps({"skill": "api-backend"}))
+        assert _detect_skill() == "api-backend"
+        skill_file.write_text(json.dumps({"skill": "landing-page", "agents": []}))
+        assert _detect_skill() == "landing-page"
+
+    def test_design_choices_reads_both_files(self, tmp_path, monkeypatch):
+        from forja.planner import _read_design_choices
+        monkeypatch.chdir(tmp_path)
+        brand = tmp_path / "context" / "company" / "brand-assets"
+        brand.mkdir(parents=True)
+        (brand / "colors.json").write_text(json.dumps({"primary": "#111", "style": "minimal"}))
+        (brand / "typography.json").write_text("{not json")
+        design = _read_design_choices()
+        assert "Primary color: #111" in design
+        assert "Visual style: minimal" in design
+        assert "Font:" not in design
+
+    def test_design_choices_follow_cwd(self, tmp_path, monkeypatch):
+        from forja.planner import _read_design_choices
+        one = tmp_path / "one"
+        brand = one / "context" / "company" / "brand-assets"
+        brand.mkdir(parents=True)
+        (brand / "typography.json").write_text(json.dumps({"family": "Inter"}))
+        two = tmp_path / "two"
+        two.mkdir()
+        monkeypatch.chdir(one)
+        assert "Font: Inter" in _read_design_choices()
+        monkeypatch.chdir(two)
+        assert _read_design_choices() == ""
+
+
+class TestCollectDesignContext:
+    """Verify _collect_design_context writes files and returns their text."""
+
+    def test_returns_written_sections(self, tmp_path, monkeypatch):
+        from forja.planner import _collect_design_context
+        monkeypatch.chdir(tmp_path)
+        answers = iter(["https://example.com", "", "playful"])
+        with patch("builtins.input", side_effect=lambda _: next(answers)), \
+             patch("forja.planner._flush_stdin"):
+            ctx = _collect_design_context()
+        design_dir = tmp_path / "context" / "design-system"
+        expected = "\n\n".join(
+            (design_dir / f).read_text(encoding="utf-8").strip()
+            for f in ("references.md", "colors.md", "style.md")
+        )
+        assert ctx == expected
+        assert "Style: playful" in ctx
+
+    def test_keeps_existing_references(self, tmp_path, monkeypatch):
+        from forja.planner import _collect_design_context
+        monkeypatch.chdir(tmp_path)
+        design_dir = tmp_path / "context" / "design-system"
+        design_dir.mkdir(parents=True)
+        (design_dir / "references.md").write_text("# Visual References\n\n- old.png\n")
+        with patch("builtins.input", return_value=""), \
+             patch("forja.planner._flush_stdin"):
+            ctx = _collect_design_context()
+        assert ctx.startswith("# Visual References\n\n- old.png")
+        assert "Style: minimal" in ctx
+
+    def test_all_skipped_returns_default_design_context(self, tmp_path, monkeypatch):
+        from forja.planner import _DEFAULT_DESIGN_CONTEXT, _collect_design_context
+        monkeypatch.chdir(tmp_path)
+        with patch("builtins.input", return_value=""), \
+             patch("forja.planner._flush_stdin"):
+            assert _collect_design_context() == _DEFAULT_DESIGN_CONTEXT
+
+
 class TestSkillPrdConstraints:
     """Verify SKILL_PRD_CONSTRAINTS are applied to PRD generation."""
 
@@ -624,6 +976,34 @@ class TestSkillPrdConstraints:
         assert "SINGLE index.html" in system_sent
         assert "valid JSON" in system_sent
 
+    def test_prd_system_msg_leads_with_static_rules(self):
+        """Static rules lead the system message; it is too short to mark cacheable."""
+        from forja.planner import _generate_prd_from_idea
+        with patch("forja.planner._call_claude_code", return_value=None) as mock_llm:
+            _generate_prd_from_idea("A page", skill="landing-page")
+        system_sent = mock_llm.call_args[1].get("system", "")
+        assert system_sent.startswith("ANTI-HALLUCINATION")
+        assert system_sent.index("senior product manager") < system_sent.index("CRITICAL CONSTRAINT")
+        assert not mock_llm.call_args[1].get("cache_system")
+
+    def test_prd_edits_send_prd_as_cacheable_prefix(self):
+        """The PRD leads as cache_prefix; only the feedback is in the prompt."""
+        from forja.planner import _modify_prd_section, _regenerate_prd_with_feedback
+        for fn in (_modify_prd_section, _regenerate_prd_with_feedback):
+            with patch("forja.planner._call_claude_code", return_value=None) as mock_llm:
+                fn("# Prefix PRD body", f"tweak via {fn.__name__}")
+            prompt, kwargs = mock_llm.call_args[0][0], mock_llm.call_args[1]
+            assert kwargs["cache_prefix"].endswith("# Prefix PRD body\n\n")
+            assert "# Prefix PRD body" not in prompt
+            assert f"tweak via {fn.__name__}" in prompt
+
+    def test_enriched_prd_sends_original_prd_as_cacheable_prefix(self):
+        from forja.planner import _generate_enriched_prd
+        with patch("forja.planner._call_claude_code", return_value="# PRD") as mock_llm:
+            _generate_enriched_prd("# Original body", [], [])
+        assert mock_llm.call_args[1]["cache_prefix"] == "Original PRD:\n# Original body\n\n"
+        assert "# Original body" not in mock_llm.call_args[0][0]
+
     def test_prd_system_msg_no_constraint_for_custom(self):
         """System message has no constraint for custom skill."""
         from forja.planner import _generate_prd_from_idea
@@ -634,6 +1014,133 @@ class TestSkillPrdConstraints:
         assert "valid JSON" in system_sent
 
 
+    def test_prd_draft_streams_to_stderr(self, capsys):
+        """Streamed chunks are echoed to stderr; JSON is parsed only at the end."""
+        from forja.planner import _generate_prd_from_idea
+        chunks = ['{"title": "Notes', ' API", "features": []}']
+
+        def fake_stream(prompt, system="", on_chunk=None, **kwargs):
+            for c in chunks:
+                on_chunk(c)
+            return "".join(chunks)
+
+        with patch("forja.planner._call_claude_code", side_effect=fake_stream):
+            prd, title = _generate_prd_from_idea("Notes API")
+        assert title == "Notes API"
+        err = capsys.readouterr().err
+        assert '{"title": "Notes' in err
+        assert ' API", "features": []}' in err
+
+
+class TestPrdCache:
+    """Verify the opt-in PRD draft cache in _generate_prd_from_idea."""
+
+    _RESPONSE = json.dumps({"title": "Notes", "problem": "p", "features": ["a"], "stack": {}})
+
+    def test_disabled_by_default(self, tmp_path, monkeypatch):
+        from forja.planner import _generate_prd_from_idea
+        monkeypatch.delenv("FORJA_PRD_CACHE", raising=False)
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        with patch("forja.planner._call_claude_code", return_value=self._RESPONSE) as mock_llm:
+            _generate_prd_from_idea("Notes app")
+            _generate_prd_from_idea("Notes app")
+        assert mock_llm.call_count == 2
+        assert not (tmp_path / ".forja" / "cache").exists()
+
+    def test_hit_skips_llm(self, tmp_path, monkeypatch):
+        from forja.planner import _generate_prd_from_idea
+        monkeypatch.setenv("FORJA_PRD_CACHE", "1")
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        with patch("forja.planner._call_claude_code", return_value=self._RESPONSE) as mock_llm:
+            first = _generate_prd_from_idea("Notes app")
+            second = _generate_prd_from_idea("Notes app")
+            _generate_prd_from_idea("Another app")
+        assert first == second
+        assert first[1] == "Notes"
+        assert mock_llm.call_count == 2
+
+    def test_expired_entry_is_ignored(self, tmp_path, monkeypatch):
+        import os
+        from forja.planner import _generate_prd_from_idea, _PRD_CACHE_TTL_SECONDS
+        monkeypatch.setenv("FORJA_PRD_CACHE", "1")
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        with patch("forja.planner._call_claude_code", return_value=self._RESPONSE) as mock_llm:
+            _generate_prd_from_idea("Notes app")
+            for entry in (tmp_path / ".forja" / "cache").rglob("*.json"):
+                old = entry.stat().st_mtime - _PRD_CACHE_TTL_SECONDS - 1
+                os.utime(entry, (old, old))
+            _generate_prd_from_idea("Notes app")
+        assert mock_llm.call_count == 2
+
+    def test_idea_differing_in_case_and_punctuation_hits_cache(self, tmp_path, monkeypatch):
+        from forja.planner import _generate_prd_from_idea
+        monkeypatch.setenv("FORJA_PRD_CACHE", "1")
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        with patch("forja.planner._call_claude_code", return_value=self._RESPONSE) as mock_llm:
+            first = _generate_prd_from_idea("A todo app with tags and due dates.")
+            second = _generate_prd_from_idea("a  todo app with Tags and due dates!")
+        assert second == first
+        assert mock_llm.call_count == 1
+
+    def test_edited_idea_misses_cache(self, tmp_path, monkeypatch):
+        from forja.planner import _generate_prd_from_idea
+        monkeypatch.setenv("FORJA_PRD_CACHE", "1")
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        idea = (
+            "A team dashboard for tracking sprint velocity. Users sign in with {}. "
+            "The frontend is built with {} and talks to a small REST API."
+        )
+        with patch("forja.planner._call_claude_code", return_value=self._RESPONSE) as mock_llm:
+            _generate_prd_from_idea(idea.format("email", "React"))
+            _generate_prd_from_idea(idea.format("Google", "Vue"))
+        assert mock_llm.call_count == 2
+
+    def test_cache_is_scoped_by_skill(self, tmp_path, monkeypatch):
+        from forja.planner import _generate_prd_from_idea
+        monkeypatch.setenv("FORJA_PRD_CACHE", "1")
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        with patch("forja.planner._call_claude_code", return_value=self._RESPONSE) as mock_llm:
+            _generate_prd_from_idea("A todo app with tags", skill="landing-page")
+            _generate_prd_from_idea("A todo app with tags", skill="api-backend")
+        assert mock_llm.call_count == 2
+
+
+class TestLlmCache:
+    """Verify FORJA_LLM_CACHE covers the enriched PRD and panel calls."""
+
+    def test_enriched_prd_cached_when_enabled(self, tmp_path, monkeypatch):
+        from forja.planner import _generate_enriched_prd
+        monkeypatch.setenv("FORJA_LLM_CACHE", "1")
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        with patch("forja.planner._call_claude_code", return_value="```\n# PRD v2\n```") as mock_llm:
+            first = _generate_enriched_prd("# PRD", [], [])
+            second = _generate_enriched_prd("# PRD", [], [])
+        assert first == second == "# PRD v2"
+        assert mock_llm.call_count == 1
+
+    def test_panel_cached_only_when_parsed(self, tmp_path, monkeypatch):
+        from forja.planner import _request_panel, HOW_PANEL_PROMPT
+        monkeypatch.setenv("FORJA_LLM_CACHE", "1")
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        panel = {"experts": [], "questions": []}
+        with patch("forja.planner._call_claude_code",
+                   side_effect=["not json", json.dumps(panel), "unused"]) as mock_llm:
+            assert _request_panel(HOW_PANEL_PROMPT, "# PRD", "", "") is None
+            assert _request_panel(HOW_PANEL_PROMPT, "# PRD", "", "") == panel
+            assert _request_panel(HOW_PANEL_PROMPT, "# PRD", "", "") == panel
+        assert mock_llm.call_count == 2
+
+    def test_disabled_by_default(self, tmp_path, monkeypatch):
+        from forja.planner import _generate_enriched_prd
+        monkeypatch.delenv("FORJA_LLM_CACHE", raising=False)
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        with patch("forja.planner._call_claude_code", return_value="# PRD") as mock_llm:
+            _generate_enriched_prd("# PRD", [], [])
+            _generate_enriched_prd("# PRD", [], [])
+        assert mock_llm.call_count == 2
+        assert not (tmp_path / ".forja" / "cache").exists()
+
+
 class TestScratchFlowSkill:
     """Verify _scratch_flow passes skill to _generate_prd_from_idea."""
 
@@ -856,6 +1363,141 @@ class TestRunExpertQa:
         assert all(a["tag"] == "SKIPPED" for a in transcript[1:])
         assert len(transcript) == len(questions)
 
+    def test_fallback_returns_copies_of_constants(self):
+        """The fallback panel is copied so callers cannot mutate the constants."""
+        from forja.planner import (
+            _run_expert_qa, WHAT_PANEL_PROMPT,
+            FALLBACK_WHAT_EXPERTS, FALLBACK_WHAT_QUESTIONS,
+        )
+        with patch("forja.planner._call_claude_code", return_value=None), \
+             patch("builtins.input", return_value=""):
+            experts, questions, _, _, _ = _run_expert_qa(
+                prompt_template=WHAT_PANEL_PROMPT,
+                fallback_experts=FALLBACK_WHAT_EXPERTS,
+                fallback_questions=FALLBACK_WHAT_QUESTIONS,
+                prd_content="# Test PRD",
+                prd_title="Test",
+                context="",
+                skill_guidance="",
+                round_label="WHAT",
+            )
+        assert isinstance(FALLBACK_WHAT_QUESTIONS, tuple)
+        questions[0]["default"] = "changed"
+        assert FALLBACK_WHAT_QUESTIONS[0]["default"] != "changed"
+        assert experts[0] is not FALLBACK_WHAT_EXPERTS[0]
+
+    def test_done_on_duplicate_question_skips_only_the_rest(self):
+        """'done' on a repeated question fills from its own position."""
+        from forja.planner import (
+            _run_expert_qa, HOW_PANEL_PROMPT, FALLBACK_HOW_EXPERTS,
+        )
+        expert = FALLBACK_HOW_EXPERTS[0]["name"]
+        dup = {"id": 1, "expert_name": expert, "question": "Same?",
+               "why": "", "default": "yes"}
+        fallback_qs = [dict(dup), dict(dup), dict(dup, id=3, question="Last?")]
+        inputs = iter(["", "done"])
+        with patch("forja.planner._call_claude_code", return_value=None), \
+             patch("builtins.input", side_effect=inputs):
+            _, questions, transcript, _, _ = _run_expert_qa(
+                prompt_template=HOW_PANEL_PROMPT,
+                fallback_experts=FALLBACK_HOW_EXPERTS,
+                fallback_questions=fallback_qs,
+                prd_content="# Test PRD",
+                prd_title="Test",
+                context="",
+                skill_guidance="",
+                round_label="HOW",
+                max_questions=7,
+            )
+        assert len(transcript) == len(questions) == 3
+        assert [a["tag"] for a in transcript] == ["ACCEPTED", "SKIPPED", "SKIPPED"]
+
+    def test_panel_prompt_puts_prd_last(self):
+        """Stable context leads and the volatile PRD trails the panel prompt."""
+        from forja.planner import _request_panel, WHAT_PANEL_PROMPT
+        with patch("forja.planner._call_claude_code", return_value=None) as mock_llm:
+            _request_panel(WHAT_PANEL_PROMPT, "# PRD body", "Business ctx", "Guidance")
+        prompt = mock_llm.call_args[0][0]
+        assert prompt.startswith("Available context:\nBusiness ctx")
+        assert prompt.index(WHAT_PANEL_PROMPT) < prompt.index("Guidance")
+        assert prompt.endswith("PRD:\n# PRD body")
+
+    def test_summary_counts_each_tag(self, capsys):
+        """The round summary reports FACT / ACCEPTED / SKIPPED counts."""
+        from forja.planner import (
+            _run_expert_qa, HOW_PANEL_PROMPT,
+            FALLBACK_HOW_EXPERTS, FALLBACK_HOW_QUESTIONS,
+        )
+        inputs = iter(["My answer", "", "skip", "done"])
+        with patch("forja.planner._call_claude_code", return_value=None), \
+             patch("builtins.input", side_effect=inputs):
+            _run_expert_qa(
+                prompt_template=HOW_PANEL_PROMPT,
+                fallback_experts=FALLBACK_HOW_EXPERTS,
+                fallback_questions=FALLBACK_HOW_QUESTIONS,
+                prd_content="# Test PRD",
+                prd_title="Test",
+                context="",
+                skill_guidance="",
+                round_label="HOW",
+                max_questions=7,
+            )
+        out = capsys.readouterr().out
+        assert "1 facts" in out
+        assert "1 accepted" in out
+        assert f"{len(FALLBACK_HOW_QUESTIONS) - 2} skipped" in out
+
+    def test_uses_prefetched_panel(self):
+        """A prefetched panel future replaces the LLM call."""
+        from forja.planner import (
+            _prefetch, _run_expert_qa, HOW_PANEL_PROMPT,
+            FALLBACK_HOW_EXPERTS, FALLBACK_HOW_QUESTIONS,
+        )
+        panel = {
+            "experts": [
+                {"name": "Ada", "field": "Backend", "perspective": "p"},
+                {"name": "Linus", "field": "Systems", "perspective": "p"},
+            ],
+            "questions": [
+                {"id": i, "expert_name": "Ada", "question": f"Q{i}?", "why": "w", "default": "d"}
+                for i in range(1, 4)
+            ],
+            "initial_assessment": "Prefetched",
+        }
+        future = _prefetch(lambda: panel)
+        with patch("forja.planner._call_claude_code") as mock_llm, \
+             patch("builtins.input", return_value=""):
+            experts, _, _, _, assessment = _run_expert_qa(
+                prompt_template=HOW_PANEL_PROMPT,
+                fallback_experts=FALLBACK_HOW_EXPERTS,
+                fallback_questions=FALLBACK_HOW_QUESTIONS,
+                prd_content="# PRD",
+                prd_title="T",
+                context="",
+                skill_guidance="",
+                round_label="HOW",
+                panel_future=future,
+            )
+        mock_llm.assert_not_called()
+        assert assessment == "Prefetched"
+        assert experts[0]["name"] == "Ada"
+
+    def test_prefetch_propagates_exceptions(self):
+        from forja.planner import _prefetch
+
+        def boom():
+            raise RuntimeError("nope")
+
+        with pytest.raises(RuntimeError, match="nope"):
+            _prefetch(boom).result(timeout=5)
+
+    def test_expert_color_map_first_name_wins(self):
+        from forja.planner import _expert_color_map, EXPERT_COLORS
+        experts = [{"name": "A"}, {"name": "B"}, {"name": "A"}, {"name": "C"}]
+        assert _expert_color_map(experts) == {
+            "A": EXPERT_COLORS[0], "B": EXPERT_COLORS[1], "C": EXPERT_COLORS[0],
+        }
+
     def test_returns_five_tuple(self):
         """Return type is (experts, questions, transcript, research, assessment)."""
         from forja.planner import (
@@ -883,6 +1525,103 @@ class TestRunExpertQa:
         assert isinstance(assessment, str)
 
 
+class TestPrintHeader:
+    def test_header_is_written_once(self, capsys):
+        """The header and expert panel go out in a single print call."""
+        from forja.planner import _print_header
+        experts = [{"name": "Alice", "field": "Product"}, {"name": "Bob", "field": "Infra"}]
+        with patch("builtins.print", wraps=print) as mock_print:
+            _print_header("Notes API", experts, "Looks buildable.")
+        assert mock_print.call_count == 1
+        out = capsys.readouterr().out
+        assert "PRD: Notes API" in out
+        assert out.index("Alice") < out.index("Bob") < out.index("Looks buildable.")
+
+
+class TestPrintPreview:
+    def test_truncated_preview_is_one_write(self, capsys):
+        from forja.planner import _print_preview
+        with patch("builtins.print", wraps=print) as mock_print:
+            _print_preview("a\nb\nc\n", 2)
+        assert mock_print.call_count == 1
+        out = capsys.readouterr().out
+        assert out.startswith("  a\n  b\n")
+        assert "(1 more lines)" in out
+
+    def test_empty_text_prints_nothing(self, capsys):
+        from forja.planner import _print_preview
+        _print_preview("   ", 5)
+        assert capsys.readouterr().out == ""
+
+
+class TestWritePrd:
+    def test_writes_utf8_with_trailing_newline(self, tmp_path):
+        from forja.planner import _write_prd
+        path = tmp_path / "prd.md"
+        path.write_text("old content that is longer than the new one")
+        _write_prd(path, "# PRD — café")
+        assert path.read_bytes() == "# PRD — café\n".encode("utf-8")
+
+    def test_falls_back_without_writev(self, tmp_path, monkeypatch):
+        from forja.planner import _write_prd
+        monkeypatch.delattr("os.writev")
+        path = tmp_path / "prd.md"
+        _write_prd(path, "# PRD")
+        assert path.read_text(encoding="utf-8") == "# PRD\n"
+
+    def test_completes_short_writev(self, tmp_path, monkeypatch):
+        import os
+        from forja.planner import _write_prd
+        monkeypatch.setattr(os, "writev", lambda fd, bufs: os.write(fd, bufs[0][:3]))
+        path = tmp_path / "prd.md"
+        _write_prd(path, "# PRD body")
+        assert path.read_text(encoding="utf-8") == "# PRD body\n"
+
+
+class TestStreamPreview:
+    def test_prints_lines_as_they_complete_up_to_limit(self, capsys):
+        from forja.planner import _StreamPreview
+        preview = _StreamPreview(2)
+        for chunk in ["```markdown\n# Ti", "tle\nLine one\n", "Line two\n"]:
+            preview(chunk)
+        assert capsys.readouterr().out == "  # Title\n  Line one\n"
+        preview.finish("# Title\nLine one\nLine two")
+        assert "(1 more lines)" in capsys.readouterr().out
+
+    def test_finish_flushes_trailing_partial_line(self, capsys):
+        from forja.planner import _StreamPreview
+        preview = _StreamPreview(10)
+        preview("# PRD\nlast line")
+        preview.finish("# PRD\nlast line")
+        assert capsys.readouterr().out == "  # PRD\n  last line\n"
+
+    def test_finish_without_stream_prints_whole_preview(self, capsys):
+        from forja.planner import _StreamPreview
+        _StreamPreview(1).finish("# Cached\nBody")
+        out = capsys.readouterr().out
+        assert "  # Cached" in out
+        assert "(1 more lines)" in out
+
+    def test_finish_counts_remaining_lines_of_stripped_text(self, capsys):
+        from forja.planner import _StreamPreview
+        preview = _StreamPreview(1)
+        preview("# PRD\n")
+        preview.finish("\n# PRD\na\nb\n\n")
+        assert "(2 more lines)" in capsys.readouterr().out
+
+    def test_finish_reprints_when_final_text_differs_from_stream(self, capsys):
+        """A call that failed midway leaves a stale partial; show the final text."""
+        from forja.planner import _StreamPreview
+        preview = _StreamPreview(5)
+        preview("# Draft one\nhalf a li")
+        capsys.readouterr()
+        preview.finish("# Manual PRD\nBody")
+        out = capsys.readouterr().out
+        assert "stream interrupted" in out
+        assert "  # Manual PRD\n  Body" in out
+        assert "half a li" not in out
+
+
 class TestSkillGuidance:
     """Verify skill-specific guidance for WHAT and HOW rounds."""
 
@@ -977,6 +1716,18 @@ class TestSaveTranscriptRounds:
         data = json.loads(path.read_text(encoding="utf-8"))
         assert data["research"] == research
 
+    def test_records_llm_cache_stats(self, tmp_path, monkeypatch):
+        from forja import llm_cache
+        from forja.planner import _save_transcript
+        monkeypatch.setattr("forja.planner.FORJA_DIR", tmp_path / ".forja")
+        llm_cache.reset_stats()
+        llm_cache.put(tmp_path, "k", "v")
+        llm_cache.get(tmp_path, "k")
+        llm_cache.get(tmp_path, "missing")
+        path = _save_transcript([], "# PRD")
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["llm_cache"] == {"hits": 1, "misses": 1}
+
 
 class TestPromptContent:
     """Verify WHAT and HOW prompts have the correct focus."""
@@ -999,6 +1750,98 @@ class TestPromptContent:
         assert "pip" in prompt or "npm" in prompt
 
 
+class TestGatherContext:
+    """Verify _gather_context reads store decisions and learnings."""
+
+    def test_reads_store_and_learnings(self, tmp_path, monkeypatch):
+        from forja.planner import _gather_context
+        monkeypatch.chdir(tmp_path)
+        store = tmp_path / "context" / "store"
+        store.mkdir(parents=True)
+        (store / "b.json").write_text(json.dumps({"key": "db", "value": "sqlite"}))
+        (store / "a.json").write_text(json.dumps({"key": "lang", "value": "python"}))
+        (store / "notes.txt").write_text("ignored")
+        learnings = tmp_path / "context" / "learnings"
+        learnings.mkdir()
+        (learnings / "l.jsonl").write_text(
+            json.dumps({"learning": "keep it simple"}) + "\n\nnot json\n"
+        )
+        with patch("forja.planner.gather_context", return_value=""):
+            ctx = _gather_context()
+        lines = ctx.splitlines()
+        assert lines == [
+            "[decision] lang: python",
+            "[decision] db: sqlite",
+            "[learning] keep it simple",
+        ]
+
+    def test_rereads_on_every_call(self, tmp_path, monkeypatch):
+        from forja.planner import _gather_context
+        monkeypatch.chdir(tmp_path)
+        store = tmp_path / "context" / "store"
+        store.mkdir(parents=True)
+        (store / "a.json").write_text(json.dumps({"key": "lang", "value": "python"}))
+        with patch("forja.planner.gather_context", return_value=""):
+            assert "[decision] db: sqlite" not in _gather_context()
+            (store / "b.json").write_text(json.dumps({"key": "db", "value": "sqlite"}))
+            assert "[decision] db: sqlite" in _gather_context()
+
+    def test_stops_reading_learnings_once_budget_spent(self, tmp_path, monkeypatch):
+        from forja.planner import _gather_context
+        monkeypatch.chdir(tmp_path)
+        learnings = tmp_path / "context" / "learnings"
+        learnings.mkdir(parents=True)
+        (learnings / "a.jsonl").write_text(
+            json.dumps({"learning": "x" * 1500}) + "\n" + json.dumps({"learning": "y" * 600}) + "\n"
+        )
+        (learnings / "b.jsonl").write_text(json.dumps({"learning": "short"}) + "\n")
+        with patch("forja.planner.gather_context", return_value=""):
+            ctx = _gather_context()
+        assert "x" * 1500 in ctx
+        assert "y" * 600 not in ctx
+        assert "short" not in ctx
+
+    def test_does_not_read_past_budget(self, tmp_path, monkeypatch):
+        from forja.planner import _gather_context
+        monkeypatch.chdir(tmp_path)
+        learnings = tmp_path / "context" / "learnings"
+        learnings.mkdir(parents=True)
+        big = json.dumps({"learning": "z" * 2500}) + "\n"
+        tail = "".join(json.dumps({"learning": f"n{i}"}) + "\n" for i in range(1000))
+        (learnings / "a.jsonl").write_text(big + tail)
+        with patch("forja.planner.gather_context", return_value=""), \
+             patch("forja.planner.json.loads", wraps=json.loads) as mock_loads:
+            assert _gather_context() == "No prior context available."
+        assert mock_loads.call_count == 1
+
+    def test_store_key_defaults_to_file_name(self, tmp_path, monkeypatch):
+        from forja.planner import _gather_context
+        monkeypatch.chdir(tmp_path)
+        store = tmp_path / "context" / "store"
+        store.mkdir(parents=True)
+        (store / "db.choice.json").write_text(json.dumps({"value": "sqlite"}))
+        with patch("forja.planner.gather_context", return_value=""):
+            assert _gather_context() == "[decision] db.choice: sqlite"
+
+    def test_business_context_follows_store_in_file_order(self, tmp_path, monkeypatch):
+        from forja.planner import _gather_context
+        monkeypatch.chdir(tmp_path)
+        store = tmp_path / "context" / "store"
+        store.mkdir(parents=True)
+        for i in range(12):
+            (store / f"{i:02d}.json").write_text(json.dumps({"key": f"k{i}", "value": "v"}))
+        with patch("forja.planner.gather_context", return_value="### company/a.md\nAcme"):
+            lines = _gather_context().splitlines()
+        assert lines[:12] == [f"[decision] k{i}: v" for i in range(12)]
+        assert lines[12:] == ["### company/a.md", "Acme"]
+
+    def test_no_context_dirs(self, tmp_path, monkeypatch):
+        from forja.planner import _gather_context
+        monkeypatch.chdir(tmp_path)
+        with patch("forja.planner.gather_context", return_value=""):
+            assert _gather_context() == "No prior context available."
+
+
 # ── Fix M-R: Structured context → PRD ────────────────────────────────
 
 
@@ -1022,6 +1865,19 @@ class TestReadExistingContext:
         assert "company_overview" in result
         assert "Acme" in result["company_overview"]
 
+    def test_memoized_and_invalidated_by_new_domain(self, tmp_path, monkeypatch):
+        ctx = tmp_path / "context"
+        monkeypatch.setattr("forja.planner.CONTEXT_DIR", ctx)
+        (ctx / "domains" / "a").mkdir(parents=True)
+        (ctx / "domains" / "a" / "DOMAIN.md").write_text("Devs")
+        from forja.planner import _read_existing_context
+        first = _read_existing_context()
+        first["audience"] = "mutated by caller"
+        assert _read_existing_context() == {"audience": "Devs"}
+        (ctx / "domains" / "b").mkdir()
+        (ctx / "domains" / "b" / "DOMAIN.md").write_text("Ops")
+        assert _read_existing_context() == {"audience": "Devs\n\nOps"}
+
     def test_returns_dict_with_all_domain_sections(self, tmp_path, monkeypatch):
         ctx = tmp_path / "context"
         monkeypatch.setattr("forja.planner.CONTEXT_DIR", ctx)
@@ -1053,6 +1909,28 @@ class TestReadExistingContext:
         assert "Acme" in result["company_overview"]
 
 
+    def test_domains_read_in_name_order_skipping_files(self, tmp_path, monkeypatch):
+        ctx = tmp_path / "context"
+        monkeypatch.setattr("forja.planner.CONTEXT_DIR", ctx)
+        for name, text in (("b-ops", "Ops"), ("a-devs", "Devs")):
+            (ctx / "domains" / name).mkdir(parents=True)
+            (ctx / "domains" / name / "DOMAIN.md").write_text(text)
+        (ctx / "domains" / "README.md").write_text("not a domain")
+        from forja.planner import _read_existing_context
+        assert _read_existing_context() == {"audience": "Devs\n\nOps"}
+
+    def test_strips_comment_lines_anywhere(self, tmp_path, monkeypatch):
+        ctx = tmp_path / "context"
+        monkeypatch.setattr("forja.planner.CONTEXT_DIR", ctx)
+        company_dir = ctx / "company"
+        company_dir.mkdir(parents=True)
+        (company_dir / "company-overview.md").write_text(
+            "# Acme\n<!--\nnote\n-->\nContent <!-- inline stays -->\n<!-- last -->"
+        )
+        from forja.planner import _read_existing_context
+        result = _read_existing_context()
+        assert result["company_overview"] == "# Acme\nnote\nContent <!-- inline stays -->"
+
 class TestFormatContextForPrompt:
     """Verify _format_context_for_prompt produces labelled sections."""
 
@@ -1104,6 +1982,14 @@ class TestSummarizeContextForIdea:
         assert "My Startup" in result
 
 
+    def test_description_before_title_and_short_first_line(self):
+        from forja.planner import _summarize_context_for_idea
+        ctx = {"company_overview": "We build tools for teams. Yes.\n# Acme\nLater paragraph here."}
+        assert _summarize_context_for_idea(ctx) == "Acme: We build tools for teams"
+        ctx = {"company_overview": "# Acme\nShort.\nA much longer description line."}
+        assert _summarize_context_for_idea(ctx) == "Acme"
+
+
 class TestPrdNewSchemaFields:
     """Verify _generate_prd_from_idea renders new business fields."""
 
@@ -1237,6 +2123,21 @@ class TestAntiHallucination:
         system_sent = mock_llm.call_args[1].get("system", "")
         assert "do not add" in system_sent.lower() or "do not invent" in system_sent.lower()
 
+    def test_enriched_prd_streams_to_stderr(self, capsys):
+        """Enriched PRD chunks are echoed as they arrive; fences stripped at the end."""
+        from forja.planner import _generate_enriched_prd
+        chunks = ["```markdown\n# PRD\n", "## Technical Decisions\n```"]
+
+        def fake_stream(prompt, system="", on_chunk=None, **kwargs):
+            for c in chunks:
+                on_chunk(c)
+            return "".join(chunks)
+
+        with patch("forja.planner._call_claude_code", side_effect=fake_stream):
+            result = _generate_enriched_prd("# PRD", [], [])
+        assert result == "# PRD\n## Technical Decisions"
+        assert "## Technical Decisions" in capsys.readouterr().err
+
     def test_enriched_prd_user_prompt_has_anti_hallucination(self):
         """Enriched PRD user prompt includes do-not-invent instruction."""
         from forja.planner import _generate_enriched_prd
@@ -1335,6 +2236,163 @@ class TestInteractivePrdEditUndo:
 
 # ── Cambio 2: Panel scope ────────────────────────────────────────────
 
+class TestRunPlanPrefetch:
+    """Verify run_plan overlaps panel assembly with user prompts."""
+
+    def _run(self, tmp_path, monkeypatch, scope_answers, edit=lambda t: t):
+        from forja import planner
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "context").mkdir()
+        (tmp_path / "context" / "prd.md").write_text("# Notes API\n\nA notes API.")
+        qa_result = (list(planner.FALLBACK_HOW_EXPERTS), [], [], [], "")
+
+        def fake_qa(**kwargs):
+            # Wait for the prefetch like the real round does
+            if kwargs.get("panel_future") is not None:
+                kwargs["panel_future"].result(timeout=5)
+            return qa_result
+
+        with patch("forja.planner._call_claude_code", return_value=None) as mock_llm, \
+             patch("forja.planner._ask_panel_scope", side_effect=scope_answers), \
+             patch("forja.planner._interactive_prd_edit", side_effect=edit), \
+             patch("forja.planner._collect_design_context", return_value=""), \
+             patch("forja.planner._run_expert_qa", side_effect=fake_qa) as mock_qa:
+            assert planner.run_plan(_called_from_runner=True) is True
+        panel_calls = [
+            c for c in mock_llm.call_args_list
+            if "conductor of expertise" in c.kwargs.get("system", "")
+        ]
+        return mock_qa, panel_calls
+
+    def test_what_panel_waits_for_round_scope(self, tmp_path, monkeypatch):
+        from concurrent.futures import Future
+        mock_qa, _ = self._run(tmp_path, monkeypatch, ["full", "full"])
+        labels = [c.kwargs["round_label"] for c in mock_qa.call_args_list]
+        assert labels == ["WHAT", "HOW"]
+        assert mock_qa.call_args_list[0].kwargs.get("panel_future") is None
+        assert isinstance(mock_qa.call_args_list[1].kwargs["panel_future"], Future)
+
+    def test_skipped_round_does_not_run_panel(self, tmp_path, monkeypatch):
+        mock_qa, panel_calls = self._run(tmp_path, monkeypatch, ["skip", "skip"])
+        assert mock_qa.call_count == 0
+        assert panel_calls == []
+
+    def test_how_panel_not_prefetched_after_skipped_what(self, tmp_path, monkeypatch):
+        mock_qa, panel_calls = self._run(tmp_path, monkeypatch, ["skip", "full"])
+        assert [c.kwargs["round_label"] for c in mock_qa.call_args_list] == ["HOW"]
+        assert mock_qa.call_args_list[0].kwargs["panel_future"] is None
+        assert panel_calls == []
+
+    def test_how_panel_prefetched_from_edited_prd(self, tmp_path, monkeypatch):
+        mock_qa, panel_calls = self._run(
+            tmp_path, monkeypatch, ["full", "full"], edit=lambda t: "# Edited PRD",
+        )
+        assert len(panel_calls) == 1
+        assert panel_calls[0].args[0].endswith("PRD:\n# Edited PRD")
+
+    def test_scratch_flow_prefetches_context(self, tmp_path, monkeypatch):
+        from forja import planner
+        monkeypatch.chdir(tmp_path)
+        with patch("forja.planner._prefetch") as mock_prefetch, \
+             patch("forja.planner._scratch_flow", return_value=("# Notes", False)):
+            assert planner.run_plan(_called_from_runner=True) is True
+        assert [c.args for c in mock_prefetch.call_args_list] == [
+            (planner._read_design_choices,), (planner._gather_context,),
+        ]
+
+
+class TestRunPlanFastMode:
+    """Verify fast mode skips the final LLM rewrite of the PRD."""
+
+    def _run(self, tmp_path, monkeypatch, tag="FACT", design="", **kwargs):
+        from forja import planner
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "context").mkdir()
+        (tmp_path / "context" / "prd.md").write_text("# Notes API\n\nA notes API.")
+        how_answers = [{"expert": "E", "question": "Stack?", "answer": "FastAPI", "tag": tag}]
+        qa_result = (list(planner.FALLBACK_HOW_EXPERTS), [], how_answers, [], "")
+        with patch("forja.planner._call_claude_code", return_value=None), \
+             patch("forja.planner._run_expert_qa", return_value=qa_result), \
+             patch("forja.planner._collect_design_context", return_value=design), \
+             patch("forja.planner._generate_enriched_prd",
+                   return_value="# Notes API (enriched)") as mock_enrich:
+            assert planner.run_plan(_called_from_runner=True, auto_mode=True, **kwargs)
+        return mock_enrich, (tmp_path / "context" / "prd.md").read_text()
+
+    def test_fast_flag_assembles_final_prd_without_llm(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("FORJA_SKIP_ENRICH", raising=False)
+        mock_enrich, prd = self._run(tmp_path, monkeypatch, fast=True)
+        assert mock_enrich.call_count == 1  # only the Round 1 merge
+        assert "- [FACT] Stack?: FastAPI" in prd
+
+    def test_env_var_enables_fast_mode(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("FORJA_SKIP_ENRICH", "1")
+        mock_enrich, _ = self._run(tmp_path, monkeypatch)
+        assert mock_enrich.call_count == 1
+
+    def test_default_rewrites_final_prd(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("FORJA_SKIP_ENRICH", raising=False)
+        mock_enrich, prd = self._run(tmp_path, monkeypatch)
+        assert mock_enrich.call_count == 2
+        assert prd.strip() == "# Notes API (enriched)"
+
+    def test_only_defaults_skip_both_llm_merges(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("FORJA_SKIP_ENRICH", raising=False)
+        mock_enrich, prd = self._run(tmp_path, monkeypatch, tag="SKIPPED")
+        assert mock_enrich.call_count == 0
+        assert "- [SKIPPED] Stack?: FastAPI" in prd
+        assert "## Assumption Density: 2/2" in prd
+
+    def test_accepted_suggestions_and_default_design_skip_llm_merges(self, tmp_path, monkeypatch):
+        from forja.planner import _DEFAULT_DESIGN_CONTEXT
+        monkeypatch.delenv("FORJA_SKIP_ENRICH", raising=False)
+        mock_enrich, prd = self._run(
+            tmp_path, monkeypatch, tag="ACCEPTED", design=_DEFAULT_DESIGN_CONTEXT,
+        )
+        assert mock_enrich.call_count == 0
+        assert "## Design System" in prd
+
+    def test_chosen_design_still_gets_llm_merge(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("FORJA_SKIP_ENRICH", raising=False)
+        mock_enrich, _ = self._run(
+            tmp_path, monkeypatch, tag="ACCEPTED", design="# Color Palette\n\nteal",
+        )
+        assert mock_enrich.call_count == 1  # Round 1 is all defaults; final is not
+
+    def test_final_prd_gets_experts_deduplicated_by_name(self, tmp_path, monkeypatch):
+        from forja.planner import FALLBACK_HOW_EXPERTS
+        monkeypatch.delenv("FORJA_SKIP_ENRICH", raising=False)
+        mock_enrich, _ = self._run(tmp_path, monkeypatch)
+        experts = mock_enrich.call_args_list[1][0][2]
+        assert [e["name"] for e in experts] == [e["name"] for e in FALLBACK_HOW_EXPERTS]
+
+
+class TestRunPlanPrdRead:
+    def test_existing_prd_is_read_once(self, tmp_path, monkeypatch):
+        from forja import planner
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "context").mkdir()
+        prd_file = tmp_path / "context" / "prd.md"
+        prd_file.write_text("# Notes API\n\nA notes API.\n")
+        answers = [{"question": "Stack?", "answer": "Flask", "tag": "FACT"}]
+        qa_result = (list(planner.FALLBACK_HOW_EXPERTS), [], answers, [], "")
+        reads: list[str] = []
+        real_read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self.name)
+            return real_read_text(self, *args, **kwargs)
+
+        with patch.object(Path, "read_text", counting_read_text), \
+             patch("forja.planner._call_claude_code", return_value=None), \
+             patch("forja.planner._run_expert_qa", return_value=qa_result), \
+             patch("forja.planner._collect_design_context", return_value=""), \
+             patch("forja.planner._generate_enriched_prd", return_value=None) as mock_enrich:
+            assert planner.run_plan(_called_from_runner=True, auto_mode=True)
+        assert reads.count("prd.md") == 1
+        assert mock_enrich.call_args_list[0][0][0] == "# Notes API\n\nA notes API."
+
+
 class TestAskPanelScope:
     """Verify _ask_panel_scope returns correct mode."""
 